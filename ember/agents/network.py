@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 import logging
 from pathlib import Path
@@ -20,6 +21,8 @@ logger = logging.getLogger("ember.network")
 
 DEFAULT_CONNECTIVITY_TIMEOUT = 1.0
 DEFAULT_DNS_PATHS: Sequence[str] = ("/etc/resolv.conf",)
+# Upper bound on concurrent connectivity probes.
+MAX_CONNECTIVITY_WORKERS = 16
 
 
 @dataclass
@@ -241,31 +244,34 @@ def _run_connectivity_checks(
 ) -> List[Dict[str, Any]]:
     if not targets:
         return []
-
-    results: List[Dict[str, Any]] = []
-    for target in targets:
-        host, port = _parse_target(target)
-        formatted = f"{host}:{port}"
-        start = time.perf_counter()
-        try:
-            with socket.create_connection((host, port), timeout=timeout):
-                latency = (time.perf_counter() - start) * 1000
-                results.append(
-                    {
-                        "target": formatted,
-                        "reachable": True,
-                        "latency_ms": round(latency, 2),
-                    }
-                )
-        except OSError as exc:
-            results.append(
-                {
-                    "target": formatted,
-                    "reachable": False,
-                    "detail": str(exc),
-                }
-            )
-    return results
+    if len(targets) == 1:
+        return [_check_target(targets[0], timeout)]
+
+    # Probes block on the network, so run them side by side; the total wait
+    # is then bounded by the slowest target rather than the sum of timeouts.
+    workers = min(MAX_CONNECTIVITY_WORKERS, len(targets))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(lambda target: _check_target(target, timeout), targets))
+
+
+def _check_target(target: str, timeout: float) -> Dict[str, Any]:
+    host, port = _parse_target(target)
+    formatted = f"{host}:{port}"
+    start = time.perf_counter()
+    try:
+        with socket.create_connection((host, port), timeout=timeout):
+            latency = (time.perf_counter() - start) * 1000
+            return {
+                "target": formatted,
+                "reachable": True,
+                "latency_ms": round(latency, 2),
+            }
+    except OSError as exc:
+        return {
+            "target": formatted,
+            "reachable": False,
+            "detail": str(exc),
+        }
 
 
 def _parse_target(target: str) -> Tuple[str, int]:
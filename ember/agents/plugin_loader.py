@@ -4,12 +4,13 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 import logging
+import os
 from pathlib import Path
 from typing import Any, Dict, List, Sequence
 
 import yaml
 
-from ..configuration import ConfigurationBundle, Diagnostic, DEFAULT_PLUGIN_DIRS
+from ..configuration import ConfigurationBundle, Diagnostic, DEFAULT_PLUGIN_DIRS, _load_yaml_file
 
 logger = logging.getLogger("ember.plugin")
 
@@ -80,13 +81,16 @@ def run_plugin_agent(bundle: ConfigurationBundle) -> Dict[str, Any]:
 
 def _scan_plugins(root: Path, manifest_name: str, bundle: ConfigurationBundle) -> List[Dict[str, Any]]:
     results: List[Dict[str, Any]] = []
-    if not root.exists() or not root.is_dir():
+    try:
+        # scandir reports entry types without a stat() per child
+        with os.scandir(root) as entries:
+            plugin_dirs = sorted(entry.name for entry in entries if entry.is_dir())
+    except (FileNotFoundError, NotADirectoryError):
         logger.debug("Plugin path %s missing or not a directory; skipping.", root)
         return results
 
-    for child in sorted(root.iterdir()):
-        if not child.is_dir():
-            continue
+    for name in plugin_dirs:
+        child = root / name
         manifest = child / manifest_name
         if not manifest.exists():
             continue
@@ -98,7 +102,7 @@ def _scan_plugins(root: Path, manifest_name: str, bundle: ConfigurationBundle) -
 
 def _load_manifest(plugin_dir: Path, manifest: Path, bundle: ConfigurationBundle) -> Dict[str, Any]:
     try:
-        data = yaml.safe_load(manifest.read_text(encoding="utf-8")) or {}
+        data = _load_yaml_file(manifest, manifest.stat()) or {}
     except yaml.YAMLError as exc:
         message = f"Unable to parse plugin manifest '{manifest}': {exc}"
         bundle.diagnostics.append(
@@ -57,7 +57,7 @@ def run_rag_agent(bundle: ConfigurationBundle) -> RAGAgentResult:
         embedding_model_name = rag_config.get("embedding_model", "all-MiniLM-L6-v2")
 
         # Initialize components
-        store = VectorStore(db_path)
+        store = VectorStore(db_path, quantize=bool(rag_config.get("quantize_embeddings", False)))
         store.initialize()
 
         embedding_model = get_embedding_model(embedding_model_name)
@@ -85,6 +85,7 @@ def run_rag_agent(bundle: ConfigurationBundle) -> RAGAgentResult:
                 total_chunks += stats.chunks_created
                 total_errors += stats.errors
 
+        store.prune_embedding_cache()
         store.close()
 
         detail = f"indexed {total_files} files, {total_chunks} chunks"
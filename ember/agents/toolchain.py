@@ -14,7 +14,7 @@ from typing import Any, Dict, List, Sequence
 
 import yaml
 
-from ..configuration import ConfigurationBundle, Diagnostic
+from ..configuration import ConfigurationBundle, Diagnostic, _load_yaml_file
 
 logger = logging.getLogger("ember.toolchain")
 
@@ -104,9 +104,8 @@ def run_toolchain_agent(bundle: ConfigurationBundle) -> Dict[str, Any]:
 
 
 def _load_manifest(path: Path) -> Dict[str, Any]:
-    if not path.exists():
-        raise FileNotFoundError(path)
-    data = yaml.safe_load(path.read_text(encoding="utf-8")) or {}
+    # stat() raises FileNotFoundError for a missing manifest.
+    data = _load_yaml_file(path, path.stat()) or {}
     if not isinstance(data, dict):
         raise yaml.YAMLError("Top-level manifest must be a mapping.")
     return data
@@ -3,10 +3,7 @@
 from __future__ import annotations
 
 import socket
-from typing import List
-
-from rich.console import Console
-from rich.table import Table
+from typing import TYPE_CHECKING, List
 
 from ..slash_commands import (
     SlashCommand,
@@ -14,6 +11,9 @@ from ..slash_commands import (
     render_rich,
 )
 
+if TYPE_CHECKING:
+    from rich.console import Console
+
 
 def _handler(context: SlashCommandContext, args: List[str]) -> str:
     """Manage mesh networking."""
@@ -45,6 +45,8 @@ def _handler(context: SlashCommandContext, args: List[str]) -> str:
 
 def _show_status(context: SlashCommandContext) -> str:
     """Show mesh status."""
+    from rich.table import Table
+
     mesh_config = context.config.merged.get("mesh", {}) if context.config.merged else {}
 
     def _render(console: Console) -> None:
@@ -92,7 +94,9 @@ def _show_nodes(context: SlashCommandContext) -> str:
     if not cluster:
         return "[mesh] Mesh cluster is not running. Use /mesh start to start it."
 
-    nodes = cluster.nodes
+    from rich.table import Table
+
+    nodes = cluster.snapshot()
 
     def _render(console: Console) -> None:
         table = Table(title=f"Mesh Nodes ({len(nodes)})")
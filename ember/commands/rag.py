@@ -3,10 +3,7 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import List
-
-from rich.console import Console
-from rich.table import Table
+from typing import TYPE_CHECKING, List
 
 from ..slash_commands import (
     SlashCommand,
@@ -14,6 +11,9 @@ from ..slash_commands import (
     render_rich,
 )
 
+if TYPE_CHECKING:
+    from rich.console import Console
+
 
 def _handler(context: SlashCommandContext, args: List[str]) -> str:
     """Manage the RAG system."""
@@ -39,6 +39,8 @@ def _handler(context: SlashCommandContext, args: List[str]) -> str:
 
 def _show_status(context: SlashCommandContext) -> str:
     """Show RAG system status."""
+    from rich.table import Table
+
     rag_config = context.config.merged.get("rag", {}) if context.config.merged else {}
 
     def _render(console: Console) -> None:
@@ -99,7 +101,7 @@ def _run_index(context: SlashCommandContext, args: List[str]) -> str:
 
         # Initialize components
         db_path = context.config.vault_dir / rag_config.get("db_path", "state/rag.db")
-        store = VectorStore(db_path)
+        store = VectorStore(db_path, quantize=bool(rag_config.get("quantize_embeddings", False)))
         store.initialize()
 
         embedding_model = get_embedding_model(
@@ -126,6 +128,7 @@ def _run_index(context: SlashCommandContext, args: List[str]) -> str:
                 total_files += stats.files_processed
                 total_chunks += stats.chunks_created
 
+        store.prune_embedding_cache()
         store.close()
 
         return f"[rag] Indexed {total_files} files, {total_chunks} chunks"
@@ -2,10 +2,7 @@
 
 from __future__ import annotations
 
-from typing import List
-
-from rich.console import Console
-from rich.table import Table
+from typing import TYPE_CHECKING, List
 
 from ..slash_commands import (
     SlashCommand,
@@ -13,6 +10,9 @@ from ..slash_commands import (
     render_rich,
 )
 
+if TYPE_CHECKING:
+    from rich.console import Console
+
 
 def _handler(context: SlashCommandContext, args: List[str]) -> str:
     """Manage vault synchronization."""
@@ -42,6 +42,8 @@ def _handler(context: SlashCommandContext, args: List[str]) -> str:
 
 def _show_status(context: SlashCommandContext) -> str:
     """Show sync status."""
+    from rich.table import Table
+
     sync_config = context.config.merged.get("sync", {}) if context.config.merged else {}
 
     def _render(console: Console) -> None:
@@ -129,6 +131,8 @@ def _show_manifest(context: SlashCommandContext) -> str:
         return "[sync] Sync is disabled. Enable it in configuration first."
 
     try:
+        from rich.table import Table
+
         from ..sync import SyncClient, SyncSettings
 
         settings = SyncSettings.from_config(context.config.merged)
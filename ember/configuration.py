@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-from copy import deepcopy
 from dataclasses import dataclass, field
 import os
 from pathlib import Path
@@ -10,6 +9,11 @@ from typing import Any, Callable, Dict, List, Literal, Mapping, MutableMapping,
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _SafeLoader
+
 REPO_ROOT = Path(__file__).resolve().parent.parent
 DEFAULT_CONFIG_DIR = REPO_ROOT / "config"
 
@@ -33,6 +37,9 @@ DEFAULT_PLUGIN_DIRS: List[str] = [
 ]
 DEFAULT_UPDATE_BRANCHES: List[str] = ["main", "master"]
 
+# Parsed YAML documents keyed by path; reused while (mtime_ns, size) match.
+_YAML_CACHE: Dict[Path, Tuple[int, int, Any]] = {}
+
 
 CONFIG_SCHEMA: SchemaSpec = {
     "runtime": {
@@ -247,7 +254,7 @@ CONFIG_SCHEMA: SchemaSpec = {
 }
 
 
-@dataclass
+@dataclass(slots=True)
 class Diagnostic:
     """Represents a configuration validation or loading issue."""
 
@@ -256,7 +263,7 @@ class Diagnostic:
     source: Optional[Path] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ConfigurationBundle:
     """All configuration data Ember needs at runtime."""
 
@@ -324,7 +331,10 @@ def load_runtime_configuration(vault_dir: Optional[Path] = None) -> Configuratio
         )
         files_loaded.extend(override_files)
 
-    merged = deepcopy(repo_defaults)
+    # Merging into a fresh dict rebuilds the mapping structure and copies
+    # container leaves, so ``repo_defaults`` stays untouched by validation.
+    merged: Dict[str, Any] = {}
+    _deep_merge_dicts(merged, repo_defaults)
     _deep_merge_dicts(merged, vault_overrides)
 
     _validate_schema(merged, diagnostics)
@@ -373,11 +383,20 @@ def _load_directory_configs(
         )
         return data, loaded_files
 
-    yaml_files = sorted(directory.glob("*.yml")) + sorted(directory.glob("*.yaml"))
-
-    for yaml_file in yaml_files:
+    # One directory pass; keep the historical order of every *.yml file
+    # (sorted) before every *.yaml file (sorted).
+    with os.scandir(directory) as scan:
+        entries = [
+            entry
+            for entry in scan
+            if entry.name.endswith((".yml", ".yaml")) and entry.is_file()
+        ]
+    entries.sort(key=lambda entry: (entry.name.endswith(".yaml"), entry.name))
+
+    for entry in entries:
+        yaml_file = directory / entry.name
         try:
-            content = yaml.safe_load(yaml_file.read_text(encoding="utf-8"))
+            content = _load_yaml_file(yaml_file, entry.stat())
         except yaml.YAMLError as exc:
             diagnostics.append(
                 Diagnostic(
@@ -417,24 +436,66 @@ def _load_directory_configs(
     return data, loaded_files
 
 
+def _load_yaml_file(path: Path, stat: os.stat_result) -> Any:
+    """Parse a YAML file, reusing the previous result if the file is unchanged.
+
+    Callers must treat the returned object as read-only; merging copies values
+    out of it so the cached document is never mutated.
+    """
+
+    cached = _YAML_CACHE.get(path)
+    if cached is not None and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+        return cached[2]
+
+    with path.open("rb") as handle:
+        content = yaml.load(handle, Loader=_SafeLoader)
+    _YAML_CACHE[path] = (stat.st_mtime_ns, stat.st_size, content)
+    return content
+
+
 def _deep_merge_dicts(dest: MutableMapping[str, Any], source: Mapping[str, Any]) -> None:
-    """Recursively merge mapping values."""
+    """Recursively merge mapping values.
+
+    Nested mappings are walked with an explicit stack and rebuilt as plain
+    dicts in ``dest``; other values go through ``_yaml_clone`` so ``dest``
+    never aliases a container from ``source``.
+    """
+
+    stack = [(dest, source)]
+    while stack:
+        target, incoming = stack.pop()
+        for key, value in incoming.items():
+            existing = target.get(key)
+            if isinstance(value, Mapping):
+                if not isinstance(existing, MutableMapping):
+                    existing = {}
+                    target[key] = existing
+                stack.append((existing, value))
+            else:
+                target[key] = _yaml_clone(value)
+
+
+def _yaml_clone(value: Any) -> Any:
+    """Copy a YAML-shaped value.
+
+    Safe-loaded YAML only nests dicts, lists and sets around immutable
+    scalars, so exact-type dispatch replaces ``deepcopy`` and its memo.
+    """
 
-    for key, value in source.items():
-        if (
-            key in dest
-            and isinstance(dest[key], MutableMapping)
-            and isinstance(value, Mapping)
-        ):
-            _deep_merge_dicts(dest[key], value)
-        else:
-            dest[key] = deepcopy(value)
+    value_type = type(value)
+    if value_type is dict:
+        return {key: _yaml_clone(item) for key, item in value.items()}
+    if value_type is list:
+        return [_yaml_clone(item) for item in value]
+    if value_type is set:
+        return set(value)
+    return value
 
 
 def _default_from_spec(spec: SchemaSpec) -> Any:
     if "default_factory" in spec and callable(spec["default_factory"]):
         return spec["default_factory"]()
-    return deepcopy(spec.get("default"))
+    return _yaml_clone(spec.get("default"))
 
 
 def _validate_schema(config: Dict[str, Any], diagnostics: List[Diagnostic]) -> None:
@@ -2,28 +2,59 @@
 
 from __future__ import annotations
 
+import atexit
+import copy
 import json
 import logging
-from datetime import datetime, timezone
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+import os
 from pathlib import Path
+import queue
 import sys
-from typing import Optional, Union
+import time
+from typing import List, Optional, Tuple, Union
+
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json is the fallback
+    orjson = None  # type: ignore[assignment]
 
 LOG_SUBPATH = Path("logs") / "agents" / "core.log"
 STRUCTURED_LOG_SUBPATH = Path("logs") / "agents" / "core.jsonl"
 MAX_BYTES = 5 * 1024 * 1024  # 5 MB per log segment
 BACKUP_COUNT = 3
+WRITE_BUFFER_BYTES = 1024 * 1024  # file write buffer per log handler
+FLUSH_INTERVAL = 1.0  # seconds buffered log lines may wait before a flush
 REPO_ROOT = Path(__file__).resolve().parent.parent
 FALLBACK_ROOT = REPO_ROOT / ".ember_runtime"
 
+# Shared encoder so the fallback path does not rebuild one per record.
+_JSON_ENCODER = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False)
+
+# Background listener that owns the real handlers; see setup_logging().
+_LISTENER: Optional[QueueListener] = None
+
 
 class JSONFormatter(logging.Formatter):
     """Format log records as JSON lines for structured logging."""
 
+    def __init__(self) -> None:
+        super().__init__()
+        # (epoch second, "YYYY-MM-DDTHH:MM:SS") for the last formatted record.
+        self._second_cache: Tuple[int, str] = (-1, "")
+
+    def _timestamp(self, record: logging.LogRecord) -> str:
+        """Render ``record.created`` as a UTC ISO-8601 string with milliseconds."""
+        second = int(record.created)
+        cached = self._second_cache
+        if cached[0] != second:
+            cached = (second, time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(second)))
+            self._second_cache = cached
+        return f"{cached[1]}.{int(record.msecs):03d}+00:00"
+
     def format(self, record: logging.LogRecord) -> str:
         log_entry = {
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": self._timestamp(record),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
@@ -33,7 +64,98 @@ class JSONFormatter(logging.Formatter):
         # Include any extra fields attached to the record
         if hasattr(record, "extra") and record.extra:
             log_entry["extra"] = record.extra
-        return json.dumps(log_entry)
+        if orjson is not None:
+            return orjson.dumps(log_entry).decode("utf-8")
+        return _JSON_ENCODER.encode(log_entry)
+
+
+class _BufferedRotatingFileHandler(RotatingFileHandler):
+    """Rotating file handler that buffers writes instead of flushing per record.
+
+    Lines accumulate in a large write buffer and are flushed at most every
+    ``FLUSH_INTERVAL`` seconds while records arrive, when the log queue goes
+    idle (see ``_FlushingQueueListener``), on rollover, and on close. The
+    rollover check tracks the file position in memory because seeking the
+    stream, as the stock handler does, would flush the buffer every record.
+    """
+
+    _position = 0
+    _last_flush = 0.0
+
+    def _open(self):
+        stream = open(
+            self.baseFilename,
+            self.mode,
+            buffering=WRITE_BUFFER_BYTES,
+            encoding=self.encoding,
+            errors=self.errors,
+        )
+        self._position = stream.tell()
+        self._last_flush = time.monotonic()
+        return stream
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            msg = self.format(record) + self.terminator
+            # maxBytes is a byte limit; non-ASCII text encodes to more bytes
+            # than characters.
+            size = len(msg)
+            if not msg.isascii():
+                size = len(msg.encode(self.encoding or "utf-8", "replace"))
+            if self.stream is None:
+                self.stream = self._open()
+            if (
+                self.maxBytes > 0
+                and self._position + size >= self.maxBytes
+                # Never roll over anything other than a regular file.
+                and not (
+                    os.path.exists(self.baseFilename)
+                    and not os.path.isfile(self.baseFilename)
+                )
+            ):
+                self.doRollover()
+                if self.stream is None:
+                    self.stream = self._open()
+            self.stream.write(msg)
+            self._position += size
+            now = time.monotonic()
+            if now - self._last_flush >= FLUSH_INTERVAL:
+                self.flush()
+                self._last_flush = now
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+
+class _FlushingQueueListener(QueueListener):
+    """Queue listener that flushes its handlers whenever the queue goes idle."""
+
+    def dequeue(self, block: bool) -> logging.LogRecord:
+        if not block:
+            return self.queue.get_nowait()
+        while True:
+            try:
+                return self.queue.get(timeout=FLUSH_INTERVAL)
+            except queue.Empty:
+                for handler in self.handlers:
+                    handler.flush()
+
+
+class _LocalQueueHandler(QueueHandler):
+    """Queue handler for an in-process listener.
+
+    The stock ``prepare`` formats the record and drops ``exc_info`` so it can
+    be pickled. Records here never leave the process, so only the message
+    arguments are resolved (capturing mutable args at call time) and the
+    listener's handlers still see the original exception info.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
 
 
 def setup_logging(
@@ -44,6 +166,10 @@ def setup_logging(
 ) -> Path:
     """Configure Ember logging with optional structured JSON output.
 
+    The ``ember`` logger only enqueues records; a background
+    ``QueueListener`` thread formats them and performs the file and console
+    writes, so logging callers never block on I/O.
+
     Args:
         vault_dir: Path to the vault directory for log storage.
         level: Logging level (string name or int constant).
@@ -61,7 +187,7 @@ def setup_logging(
     )
 
     # Primary file handler (human-readable text)
-    file_handler = RotatingFileHandler(
+    file_handler = _BufferedRotatingFileHandler(
         log_path,
         maxBytes=MAX_BYTES,
         backupCount=BACKUP_COUNT,
@@ -76,20 +202,25 @@ def setup_logging(
     logger = logging.getLogger("ember")
     _reset_handlers(logger)
     logger.setLevel(resolved_level)
-    logger.addHandler(file_handler)
-    logger.addHandler(console_handler)
+    handlers: List[logging.Handler] = [file_handler, console_handler]
 
     # Structured JSON handler (optional)
     if structured:
         json_path = _resolve_structured_log_path(vault_dir, structured_path)
-        json_handler = RotatingFileHandler(
+        json_handler = _BufferedRotatingFileHandler(
             json_path,
             maxBytes=MAX_BYTES,
             backupCount=BACKUP_COUNT,
             encoding="utf-8",
         )
         json_handler.setFormatter(JSONFormatter())
-        logger.addHandler(json_handler)
+        handlers.append(json_handler)
+
+    global _LISTENER
+    record_queue: queue.SimpleQueue = queue.SimpleQueue()
+    _LISTENER = _FlushingQueueListener(record_queue, *handlers, respect_handler_level=True)
+    _LISTENER.start()
+    logger.addHandler(_LocalQueueHandler(record_queue))
 
     logger.propagate = False
 
@@ -140,7 +271,20 @@ def _resolve_structured_log_path(vault_dir: Path, custom_path: Optional[str] = N
         return fallback
 
 
+def stop_logging() -> None:
+    """Drain queued records and close the handlers installed by setup_logging."""
+
+    global _LISTENER
+    listener, _LISTENER = _LISTENER, None
+    if listener is None:
+        return
+    listener.stop()
+    for handler in listener.handlers:
+        handler.close()
+
+
 def _reset_handlers(logger: logging.Logger) -> None:
+    stop_logging()
     for handler in list(logger.handlers):
         logger.removeHandler(handler)
         handler.close()
@@ -152,4 +296,7 @@ def _silence_third_party() -> None:
     logging.getLogger("llama_cpp").setLevel(logging.WARNING)
 
 
-__all__ = ["setup_logging", "JSONFormatter", "LOG_SUBPATH", "STRUCTURED_LOG_SUBPATH", "FALLBACK_ROOT"]
+atexit.register(stop_logging)
+
+
+__all__ = ["setup_logging", "stop_logging", "JSONFormatter", "LOG_SUBPATH", "STRUCTURED_LOG_SUBPATH", "FALLBACK_ROOT"]
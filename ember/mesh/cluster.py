@@ -2,12 +2,15 @@
 
 from __future__ import annotations
 
+import heapq
 import logging
 import threading
 import time
+from collections import ChainMap
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Any, Callable, Dict, List, Optional
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Mapping, Optional, Set, Tuple
 
 from .discovery import DiscoverySettings, MeshDiscovery
 from .node import NodeCapability, NodeInfo, NodeStatus, generate_node_id
@@ -16,7 +19,21 @@ from .protocol import MeshProtocol
 logger = logging.getLogger("ember.mesh.cluster")
 
 
-@dataclass
+# (config key, coercion) for every MeshSettings field read from ``mesh:``.
+_MESH_SETTINGS_CASTS = (
+    ("enabled", bool),
+    ("node_id", str),
+    ("port", int),
+    ("advertise", bool),
+    ("capabilities", list),
+    ("tls", bool),
+    ("discovery_interval", int),
+    ("health_check_interval", int),
+    ("node_timeout", int),
+)
+
+
+@dataclass(slots=True)
 class MeshSettings:
     """Settings for mesh cluster."""
 
@@ -33,20 +50,17 @@ class MeshSettings:
     @classmethod
     def from_config(cls, config: Dict[str, Any]) -> "MeshSettings":
         raw = config.get("mesh", {}) if config else {}
-        return cls(
-            enabled=bool(raw.get("enabled", False)),
-            node_id=str(raw.get("node_id", "")),
-            port=int(raw.get("port", 8378)),
-            advertise=bool(raw.get("advertise", True)),
-            capabilities=list(raw.get("capabilities", ["llm"])),
-            tls=bool(raw.get("tls", False)),
-            discovery_interval=int(raw.get("discovery_interval", 30)),
-            health_check_interval=int(raw.get("health_check_interval", 60)),
-            node_timeout=int(raw.get("node_timeout", 120)),
-        )
+        if not raw:
+            return cls()
+        # Missing keys fall back to the dataclass defaults.
+        return cls(**{
+            name: cast(raw[name])
+            for name, cast in _MESH_SETTINGS_CASTS
+            if name in raw
+        })
 
 
-@dataclass
+@dataclass(slots=True)
 class ClusterStatus:
     """Status of the mesh cluster."""
 
@@ -112,27 +126,58 @@ class MeshCluster:
             settings=discovery_settings,
             on_node_found=self._handle_node_found,
             on_node_lost=self._handle_node_lost,
+            on_node_seen=self._handle_node_seen,
         )
 
         self._protocol = MeshProtocol(self.local_node)
 
         self._nodes: Dict[str, NodeInfo] = {}
+        # Guards the node table, indexes and check schedule below; discovery
+        # callbacks and the health thread both update them. Never held
+        # across network calls.
+        self._lock = threading.Lock()
+        # Capability -> remote node ids, plus status buckets, kept in step with
+        # ``_nodes`` so capability and status queries avoid full scans.
+        self._capability_index: Dict[str, Set[str]] = {}
+        self._online_ids: Set[str] = set()
+        self._offline_ids: Set[str] = set()
+        # Min-heap of (next health check, node id). ``_next_check`` holds each
+        # node's current deadline; heap entries that disagree with it are
+        # stale and dropped when popped.
+        self._due_heap: List[Tuple[float, str]] = []
+        self._next_check: Dict[str, float] = {}
+        # Live read-only view of remote nodes layered over the local node;
+        # remote entries win on id clashes, as with the old merged copy.
+        self._all_nodes: Mapping[str, NodeInfo] = MappingProxyType(
+            ChainMap(self._nodes, {self.local_node.node_id: self.local_node})
+        )
         self._running = False
+        self._stop_event = threading.Event()
         self._health_thread: Optional[threading.Thread] = None
         self._start_time = datetime.now(timezone.utc)
         self._last_discovery: Optional[str] = None
 
     @property
-    def nodes(self) -> Dict[str, NodeInfo]:
-        """Get all known nodes including local."""
-        all_nodes = {self.local_node.node_id: self.local_node}
-        all_nodes.update(self._nodes)
-        return all_nodes
+    def nodes(self) -> Mapping[str, NodeInfo]:
+        """Get a read-only live view of all known nodes including local.
+
+        Discovery and health checks update the view from other threads, so
+        iterate ``snapshot()`` instead when listing nodes.
+        """
+        return self._all_nodes
 
     @property
     def remote_nodes(self) -> Dict[str, NodeInfo]:
         """Get only remote nodes."""
-        return dict(self._nodes)
+        with self._lock:
+            return dict(self._nodes)
+
+    def snapshot(self) -> Dict[str, NodeInfo]:
+        """Get a point-in-time copy of all known nodes including local."""
+        snapshot = {self.local_node.node_id: self.local_node}
+        with self._lock:
+            snapshot.update(self._nodes)
+        return snapshot
 
     def start(self) -> bool:
         """Start the mesh cluster."""
@@ -150,6 +195,7 @@ class MeshCluster:
 
         # Start health check thread
         self._running = True
+        self._stop_event.clear()
         self._health_thread = threading.Thread(
             target=self._health_check_loop,
             daemon=True,
@@ -162,12 +208,15 @@ class MeshCluster:
     def stop(self) -> None:
         """Stop the mesh cluster."""
         self._running = False
+        self._stop_event.set()
 
         self._discovery.stop()
 
         if self._health_thread and self._health_thread.is_alive():
             self._health_thread.join(timeout=2.0)
 
+        self._protocol.close()
+
         logger.info("Mesh cluster stopped")
 
     def discover(self) -> int:
@@ -178,38 +227,63 @@ class MeshCluster:
 
     def ping_node(self, node_id: str) -> bool:
         """Ping a specific node."""
-        if node_id not in self._nodes:
+        node = self._nodes.get(node_id)
+        if node is None:
             return False
+        return self._ping_node(node, time.time())
 
-        node = self._nodes[node_id]
-        response = self._protocol.ping(node)
+    def _ping_node(self, node: NodeInfo, now: float) -> bool:
+        """Ping ``node``, stamping it as seen at ``now`` if it answers."""
+        return self._record_ping(node, self._protocol.ping(node) is not None, now)
 
-        if response:
-            node.status = NodeStatus.ONLINE
-            node.last_seen = datetime.now(timezone.utc).isoformat()
-            return True
-        else:
-            node.status = NodeStatus.OFFLINE
+    def _record_ping(
+        self,
+        node: NodeInfo,
+        answered: bool,
+        now: float,
+        retry_at: Optional[float] = None,
+    ) -> bool:
+        """Apply the outcome of pinging ``node`` at ``now``.
+
+        A failed ping is retried at ``retry_at`` when given. Nodes that left
+        or were replaced while the ping was in flight are left untouched.
+        """
+        with self._lock:
+            if self._nodes.get(node.node_id) is not node:
+                return answered
+            if answered:
+                self._set_status(node, NodeStatus.ONLINE)
+                node.mark_seen(now)
+                self._schedule_check(node.node_id, now + self.settings.health_check_interval)
+                return True
+            self._set_status(node, NodeStatus.OFFLINE)
+            if retry_at is not None:
+                self._schedule_check(node.node_id, retry_at)
             return False
 
     def get_nodes_with_capability(self, capability: str) -> List[NodeInfo]:
         """Get all nodes with a specific capability."""
-        return [
-            node for node in self._nodes.values()
-            if node.has_capability(capability) and node.status == NodeStatus.ONLINE
-        ]
+        with self._lock:
+            node_ids = self._capability_index.get(capability)
+            if not node_ids:
+                return []
+            online_ids = self._online_ids
+            return [self._nodes[node_id] for node_id in node_ids if node_id in online_ids]
 
     def get_status(self) -> ClusterStatus:
         """Get cluster status."""
-        online = sum(1 for n in self._nodes.values() if n.status == NodeStatus.ONLINE)
-        offline = sum(1 for n in self._nodes.values() if n.status == NodeStatus.OFFLINE)
-
-        # Count capabilities
-        capabilities: Dict[str, int] = {}
-        for node in self._nodes.values():
-            if node.status == NodeStatus.ONLINE:
-                for cap in node.capabilities:
-                    capabilities[cap] = capabilities.get(cap, 0) + 1
+        with self._lock:
+            online_ids = self._online_ids
+            online = len(online_ids)
+            offline = len(self._offline_ids)
+            total = len(self._nodes)
+
+            # Count capabilities of online nodes
+            capabilities: Dict[str, int] = {}
+            for cap, node_ids in self._capability_index.items():
+                count = len(node_ids & online_ids)
+                if count:
+                    capabilities[cap] = count
 
         # Include local node capabilities
         for cap in self.local_node.capabilities:
@@ -219,7 +293,7 @@ class MeshCluster:
             local_node=self.local_node,
             nodes_online=online + 1,  # Include local node
             nodes_offline=offline,
-            total_nodes=len(self._nodes) + 1,
+            total_nodes=total + 1,
             capabilities=capabilities,
             last_discovery=self._last_discovery,
         )
@@ -231,21 +305,85 @@ class MeshCluster:
 
     def _handle_node_found(self, node: NodeInfo) -> None:
         """Handle a newly discovered node."""
-        is_new = node.node_id not in self._nodes
-        self._nodes[node.node_id] = node
+        with self._lock:
+            previous = self._nodes.get(node.node_id)
+            is_new = previous is None
+            if previous is not None:
+                self._unindex_node(previous)
+            self._nodes[node.node_id] = node
+            self._index_node(node)
+            seen = node.last_seen_ts
+            self._schedule_check(
+                node.node_id,
+                0.0 if seen is None else seen + self.settings.health_check_interval,
+            )
 
         if is_new:
             logger.info("Node joined cluster: %s (%s)", node.node_id, node.address)
             if self.on_node_joined:
                 self.on_node_joined(node)
 
+    def _handle_node_seen(self, node: NodeInfo) -> None:
+        """Handle an unchanged node being announced again."""
+        with self._lock:
+            if self._nodes.get(node.node_id) is not node:
+                return
+            self._set_status(node, NodeStatus.ONLINE)
+            # Scheduled nodes are pushed back from last_seen when their check
+            # comes due; only timed-out nodes need a new deadline here.
+            if node.node_id not in self._next_check:
+                self._schedule_check(
+                    node.node_id, node.last_seen_ts + self.settings.health_check_interval
+                )
+
     def _handle_node_lost(self, node_id: str) -> None:
         """Handle a node leaving the cluster."""
-        if node_id in self._nodes:
-            del self._nodes[node_id]
-            logger.info("Node left cluster: %s", node_id)
-            if self.on_node_left:
-                self.on_node_left(node_id)
+        with self._lock:
+            node = self._nodes.pop(node_id, None)
+            if node is None:
+                return
+            self._unindex_node(node)
+            self._next_check.pop(node_id, None)
+        logger.info("Node left cluster: %s", node_id)
+        if self.on_node_left:
+            self.on_node_left(node_id)
+
+    def _schedule_check(self, node_id: str, due: float) -> None:
+        """Set the next health-check deadline for a remote node."""
+        self._next_check[node_id] = due
+        heapq.heappush(self._due_heap, (due, node_id))
+
+    def _index_node(self, node: NodeInfo) -> None:
+        """Add a remote node to the capability index and status buckets."""
+        for cap in node.capabilities:
+            self._capability_index.setdefault(cap, set()).add(node.node_id)
+        self._track_status(node)
+
+    def _unindex_node(self, node: NodeInfo) -> None:
+        """Remove a remote node from the capability index and status buckets."""
+        for cap in node.capabilities:
+            node_ids = self._capability_index.get(cap)
+            if node_ids is not None:
+                node_ids.discard(node.node_id)
+                if not node_ids:
+                    del self._capability_index[cap]
+        self._online_ids.discard(node.node_id)
+        self._offline_ids.discard(node.node_id)
+
+    def _set_status(self, node: NodeInfo, status: NodeStatus) -> None:
+        """Update a remote node's status and the matching bucket."""
+        node.status = status
+        self._track_status(node)
+
+    def _track_status(self, node: NodeInfo) -> None:
+        if node.status == NodeStatus.ONLINE:
+            self._online_ids.add(node.node_id)
+        else:
+            self._online_ids.discard(node.node_id)
+        if node.status == NodeStatus.OFFLINE:
+            self._offline_ids.add(node.node_id)
+        else:
+            self._offline_ids.discard(node.node_id)
 
     def _health_check_loop(self) -> None:
         """Background loop for health checking nodes."""
@@ -255,35 +393,53 @@ class MeshCluster:
             except Exception as e:
                 logger.error("Health check error: %s", e)
 
-            # Wait for next interval
-            for _ in range(self.settings.health_check_interval):
-                if not self._running:
-                    break
-                time.sleep(1)
+            # Wait for next interval; stop() wakes us immediately
+            if self._stop_event.wait(self.settings.health_check_interval):
+                break
 
     def _check_node_health(self) -> None:
-        """Check health of all known nodes."""
-        now = datetime.now(timezone.utc)
-
-        for node_id, node in list(self._nodes.items()):
-            # Skip if recently seen
-            if node.last_seen:
-                try:
-                    last_seen = datetime.fromisoformat(node.last_seen.replace("Z", "+00:00"))
-                    age = (now - last_seen).total_seconds()
-
-                    if age < self.settings.health_check_interval:
+        """Check health of the nodes whose check deadline has passed."""
+        now = time.time()
+        interval = self.settings.health_check_interval
+        heap = self._due_heap
+        to_ping: List[NodeInfo] = []
+
+        with self._lock:
+            while heap and heap[0][0] <= now:
+                due, node_id = heapq.heappop(heap)
+                if self._next_check.get(node_id) != due:
+                    continue  # superseded deadline or node left
+
+                node = self._nodes.get(node_id)
+                if node is None:
+                    self._next_check.pop(node_id, None)
+                    continue
+
+                if node.last_seen_ts is not None:
+                    age = now - node.last_seen_ts
+
+                    # Seen since this deadline was set
+                    if age < interval:
+                        self._schedule_check(node_id, node.last_seen_ts + interval)
                         continue
 
+                    # Timed out; left unscheduled until it is seen again
                     if age > self.settings.node_timeout:
-                        node.status = NodeStatus.OFFLINE
+                        self._set_status(node, NodeStatus.OFFLINE)
+                        del self._next_check[node_id]
                         continue
 
-                except Exception:
-                    pass
+                to_ping.append(node)
+
+        if not to_ping:
+            return
 
-            # Ping the node
-            self.ping_node(node_id)
+        # Ping due nodes concurrently without holding the lock; success
+        # reschedules from the new last_seen, failure retries after another
+        # interval.
+        responses = self._protocol.ping_many(to_ping)
+        for node in to_ping:
+            self._record_ping(node, node.node_id in responses, now, retry_at=now + interval)
 
 
 __all__ = ["MeshCluster", "MeshSettings", "ClusterStatus"]
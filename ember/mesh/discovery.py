@@ -4,14 +4,26 @@ from __future__ import annotations
 
 import json
 import logging
+import selectors
 import socket
 import threading
 import time
 from dataclasses import dataclass, field
-from typing import Callable, Dict, List, Optional
+from types import MappingProxyType
+from typing import Callable, Dict, List, Mapping, Optional, Tuple
 
 from .node import NodeInfo, NodeStatus
 
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json is the fallback
+    orjson = None  # type: ignore[assignment]
+
+try:
+    from zeroconf import ServiceBrowser, ServiceInfo, Zeroconf
+except ImportError:  # mDNS is optional; UDP broadcast is the fallback
+    ServiceBrowser = ServiceInfo = Zeroconf = None  # type: ignore[assignment,misc]
+
 logger = logging.getLogger("ember.mesh.discovery")
 
 # Service type for Ember mesh nodes
@@ -19,7 +31,7 @@ SERVICE_TYPE = "_ember._tcp.local."
 SERVICE_NAME_PREFIX = "ember-node-"
 
 
-@dataclass
+@dataclass(slots=True)
 class DiscoverySettings:
     """Settings for mesh discovery."""
 
@@ -30,7 +42,7 @@ class DiscoverySettings:
     service_type: str = SERVICE_TYPE
 
 
-@dataclass
+@dataclass(slots=True)
 class DiscoveryResult:
     """Result of a discovery operation."""
 
@@ -48,32 +60,44 @@ class MeshDiscovery:
         settings: DiscoverySettings,
         on_node_found: Optional[Callable[[NodeInfo], None]] = None,
         on_node_lost: Optional[Callable[[str], None]] = None,
+        on_node_seen: Optional[Callable[[NodeInfo], None]] = None,
     ):
         self.local_node = local_node
         self.settings = settings
         self.on_node_found = on_node_found
         self.on_node_lost = on_node_lost
+        self.on_node_seen = on_node_seen
 
         self._known_nodes: Dict[str, NodeInfo] = {}
+        self._known_nodes_view = MappingProxyType(self._known_nodes)
         self._running = False
         self._discovery_thread: Optional[threading.Thread] = None
         self._zeroconf = None
         self._service_info = None
+        # Long-lived UDP socket and selector used by the fallback loop, plus a
+        # socket pair that stop() writes to so the loop wakes immediately.
+        self._udp_socket: Optional[socket.socket] = None
+        self._selector: Optional[selectors.BaseSelector] = None
+        self._wakeup: Optional[Tuple[socket.socket, socket.socket]] = None
 
     @property
-    def known_nodes(self) -> Dict[str, NodeInfo]:
-        """Get all known nodes."""
-        return dict(self._known_nodes)
+    def known_nodes(self) -> Mapping[str, NodeInfo]:
+        """Get all known nodes.
+
+        Returns a read-only live view; call ``dict()`` on it for a snapshot.
+        """
+        return self._known_nodes_view
 
     def start(self) -> bool:
         """Start discovery and optionally advertise the local node."""
         if self._running:
             return True
 
-        try:
-            # Try to use zeroconf for mDNS
-            from zeroconf import ServiceBrowser, ServiceInfo, Zeroconf
+        if Zeroconf is None:
+            logger.warning("zeroconf not available, using fallback discovery")
+            return self._start_fallback_discovery()
 
+        try:
             self._zeroconf = Zeroconf()
 
             # Advertise local node
@@ -91,10 +115,6 @@ class MeshDiscovery:
             logger.info("Mesh discovery started with mDNS")
             return True
 
-        except ImportError:
-            logger.warning("zeroconf not available, using fallback discovery")
-            return self._start_fallback_discovery()
-
         except Exception as e:
             logger.error("Failed to start mesh discovery: %s", e)
             return False
@@ -112,9 +132,17 @@ class MeshDiscovery:
                 logger.warning("Error stopping zeroconf: %s", e)
             self._zeroconf = None
 
+        if self._wakeup is not None:
+            try:
+                self._wakeup[1].send(b"\0")
+            except OSError:
+                pass
+
         if self._discovery_thread and self._discovery_thread.is_alive():
             self._discovery_thread.join(timeout=2.0)
 
+        self._close_udp_socket()
+
         logger.info("Mesh discovery stopped")
 
     def discover_once(self) -> DiscoveryResult:
@@ -140,8 +168,6 @@ class MeshDiscovery:
     def _advertise_node(self) -> None:
         """Advertise the local node via mDNS."""
         try:
-            from zeroconf import ServiceInfo
-
             properties = {
                 b"node_id": self.local_node.node_id.encode(),
                 b"version": self.local_node.version.encode(),
@@ -165,6 +191,13 @@ class MeshDiscovery:
 
     def _start_fallback_discovery(self) -> bool:
         """Start fallback discovery using UDP broadcast."""
+        try:
+            self._open_udp_socket()
+        except OSError as e:
+            logger.error("Failed to open discovery socket: %s", e)
+            self._close_udp_socket()
+            return False
+
         self._running = True
         self._discovery_thread = threading.Thread(
             target=self._fallback_discovery_loop,
@@ -174,19 +207,107 @@ class MeshDiscovery:
         logger.info("Mesh discovery started with UDP fallback")
         return True
 
+    def _open_udp_socket(self) -> None:
+        """Open the long-lived discovery socket and register it for reads.
+
+        The socket binds the discovery port so unsolicited announcements are
+        received as well as replies to our broadcasts; if another process
+        already holds the port it falls back to an ephemeral one.
+        """
+        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
+        try:
+            sock.bind(("", self.settings.port))
+        except OSError:
+            sock.bind(("", 0))
+        sock.setblocking(False)
+        self._udp_socket = sock
+
+        self._wakeup = socket.socketpair()
+        self._wakeup[0].setblocking(False)
+
+        self._selector = selectors.DefaultSelector()
+        self._selector.register(sock, selectors.EVENT_READ)
+        self._selector.register(self._wakeup[0], selectors.EVENT_READ)
+
+    def _close_udp_socket(self) -> None:
+        """Close the discovery socket, selector and wakeup pair."""
+        if self._selector is not None:
+            self._selector.close()
+            self._selector = None
+        if self._udp_socket is not None:
+            self._udp_socket.close()
+            self._udp_socket = None
+        if self._wakeup is not None:
+            for sock in self._wakeup:
+                sock.close()
+            self._wakeup = None
+
     def _fallback_discovery_loop(self) -> None:
-        """Background loop for fallback discovery."""
+        """Background loop for fallback discovery.
+
+        Broadcasts a discovery request every ``discovery_interval`` seconds
+        and otherwise sleeps in the selector until datagrams arrive.
+        """
+        sock = self._udp_socket
+        selector = self._selector
+        wakeup = self._wakeup[0]
+        next_scan = 0.0
+
         while self._running:
+            now = time.monotonic()
+            if now >= next_scan:
+                try:
+                    sock.sendto(self._discovery_request(), ("<broadcast>", self.settings.port))
+                except OSError as e:
+                    logger.debug("UDP discovery broadcast error: %s", e)
+                next_scan = now + self.settings.discovery_interval
+
             try:
-                self.discover_once()
-            except Exception as e:
+                events = selector.select(timeout=max(0.0, next_scan - time.monotonic()))
+            except OSError as e:
                 logger.error("Fallback discovery error: %s", e)
+                break
 
-            # Wait for next interval
-            for _ in range(self.settings.discovery_interval):
-                if not self._running:
-                    break
-                time.sleep(1)
+            for key, _ in events:
+                if key.fileobj is wakeup:
+                    return
+                self._drain_udp_socket(sock)
+
+    def _drain_udp_socket(self, sock: socket.socket) -> None:
+        """Read every pending datagram from the non-blocking discovery socket."""
+        while True:
+            try:
+                data, _addr = sock.recvfrom(1024)
+            except (BlockingIOError, InterruptedError):
+                return
+            except OSError as e:
+                logger.debug("UDP discovery receive error: %s", e)
+                return
+
+            node = self._parse_datagram(data)
+            if node is not None:
+                self._add_node(node)
+
+    def _discovery_request(self) -> bytes:
+        """Return the broadcast payload asking peers to announce themselves."""
+        return json.dumps({
+            "type": "discover",
+            "node_id": self.local_node.node_id,
+        }).encode()
+
+    def _parse_datagram(self, data: bytes) -> Optional[NodeInfo]:
+        """Parse an announce datagram from another node, ignoring anything else."""
+        try:
+            response = orjson.loads(data) if orjson is not None else json.loads(data)
+            if response.get("type") == "announce" and "node_info" in response:
+                node = NodeInfo.from_dict(response["node_info"])
+                if node.node_id != self.local_node.node_id:
+                    return node
+        except Exception as e:
+            logger.debug("Ignoring malformed discovery datagram: %s", e)
+        return None
 
     def _udp_discovery_scan(self) -> List[NodeInfo]:
         """Scan for nodes using UDP broadcast."""
@@ -199,27 +320,19 @@ class MeshDiscovery:
             sock.settimeout(2.0)
 
             # Send discovery request
-            request = json.dumps({
-                "type": "discover",
-                "node_id": self.local_node.node_id,
-            }).encode()
-
-            sock.sendto(request, ("<broadcast>", self.settings.port))
+            sock.sendto(self._discovery_request(), ("<broadcast>", self.settings.port))
 
             # Collect responses
             while True:
                 try:
                     data, addr = sock.recvfrom(1024)
-                    response = json.loads(data.decode())
-
-                    if response.get("type") == "announce" and "node_info" in response:
-                        node = NodeInfo.from_dict(response["node_info"])
-                        if node.node_id != self.local_node.node_id:
-                            discovered.append(node)
-
                 except socket.timeout:
                     break
 
+                node = self._parse_datagram(data)
+                if node is not None:
+                    discovered.append(node)
+
             sock.close()
 
         except Exception as e:
@@ -227,14 +340,29 @@ class MeshDiscovery:
 
         return discovered
 
-    def _add_node(self, node: NodeInfo) -> None:
-        """Add a discovered node."""
+    def _add_node(self, node: NodeInfo) -> bool:
+        """Add a discovered node.
+
+        Re-discovering a node whose endpoint, capabilities and version are
+        unchanged only refreshes the known entry's ``last_seen`` and reports
+        it through ``on_node_seen``, which then owns the status change.
+        Returns True when the node is new or changed.
+        """
+        existing = self._known_nodes.get(node.node_id)
+        if existing is not None and _node_identity(existing) == _node_identity(node):
+            existing.mark_seen()
+            if self.on_node_seen:
+                self.on_node_seen(existing)
+            else:
+                existing.status = NodeStatus.ONLINE
+            return False
+
         node.status = NodeStatus.ONLINE
-        is_new = node.node_id not in self._known_nodes
         self._known_nodes[node.node_id] = node
 
-        if is_new and self.on_node_found:
+        if self.on_node_found:
             self.on_node_found(node)
+        return True
 
     def _remove_node(self, node_id: str) -> None:
         """Remove a node that is no longer available."""
@@ -246,15 +374,18 @@ class MeshDiscovery:
     # ServiceListener callbacks for zeroconf
     def add_service(self, zc, service_type: str, name: str) -> None:
         """Called when a new service is discovered."""
-        try:
-            from zeroconf import ServiceInfo
+        if not self._is_ember_service(service_type, name):
+            return
 
+        try:
             info = zc.get_service_info(service_type, name)
             if info:
                 node = self._parse_service_info(info)
                 if node and node.node_id != self.local_node.node_id:
-                    self._add_node(node)
-                    logger.info("Discovered node: %s at %s", node.node_id, node.address)
+                    # update_service re-enters here on every TXT refresh;
+                    # unchanged nodes are only marked as seen.
+                    if self._add_node(node):
+                        logger.info("Discovered node: %s at %s", node.node_id, node.address)
 
         except Exception as e:
             logger.error("Error processing service: %s", e)
@@ -271,6 +402,10 @@ class MeshDiscovery:
         """Called when a service is updated."""
         self.add_service(zc, service_type, name)
 
+    def _is_ember_service(self, service_type: str, name: str) -> bool:
+        """Cheap name/type check done before any mDNS query for the service."""
+        return service_type == self.settings.service_type and name.startswith(SERVICE_NAME_PREFIX)
+
     def _parse_service_info(self, info) -> Optional[NodeInfo]:
         """Parse a ServiceInfo into a NodeInfo."""
         try:
@@ -303,4 +438,9 @@ class MeshDiscovery:
             return None
 
 
+def _node_identity(node: NodeInfo) -> Tuple[str, int, Tuple[str, ...], str]:
+    """Fields whose change makes a re-discovered node worth reporting."""
+    return (node.ip_address, node.port, tuple(node.capabilities), node.version)
+
+
 __all__ = ["MeshDiscovery", "DiscoverySettings", "DiscoveryResult"]
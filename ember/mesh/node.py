@@ -2,11 +2,12 @@
 
 from __future__ import annotations
 
+import time
 import uuid
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 
 class NodeStatus(str, Enum):
@@ -26,7 +27,7 @@ class NodeCapability(str, Enum):
     RAG = "rag"              # Has RAG capabilities
 
 
-@dataclass
+@dataclass(slots=True)
 class NodeInfo:
     """Information about a mesh node."""
 
@@ -39,10 +40,25 @@ class NodeInfo:
     status: NodeStatus = NodeStatus.UNKNOWN
     last_seen: Optional[str] = None
     metadata: Dict[str, Any] = field(default_factory=dict)
+    # Epoch seconds mirroring ``last_seen`` so health checks can compare
+    # ages without parsing the ISO string; not part of the wire format.
+    last_seen_ts: Optional[float] = field(default=None, compare=False, repr=False)
+    # (ip_address, port, address, url) for the endpoint last formatted.
+    _endpoint: Optional[Tuple[str, int, str, str]] = field(
+        default=None, init=False, compare=False, repr=False
+    )
 
     def __post_init__(self):
         if self.last_seen is None:
-            self.last_seen = datetime.now(timezone.utc).isoformat()
+            self.mark_seen()
+        elif self.last_seen_ts is None:
+            self.last_seen_ts = _parse_timestamp(self.last_seen)
+
+    def mark_seen(self, timestamp: Optional[float] = None) -> None:
+        """Record that the node was seen at ``timestamp`` (default: now)."""
+        seen = time.time() if timestamp is None else timestamp
+        self.last_seen_ts = seen
+        self.last_seen = _format_timestamp(seen)
 
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -74,18 +90,53 @@ class NodeInfo:
     @property
     def address(self) -> str:
         """Get the full address for this node."""
-        return f"{self.ip_address}:{self.port}"
+        return self._endpoint_strings()[2]
 
     @property
     def url(self) -> str:
         """Get the HTTP URL for this node."""
-        return f"http://{self.ip_address}:{self.port}"
+        return self._endpoint_strings()[3]
+
+    def _endpoint_strings(self) -> Tuple[str, int, str, str]:
+        """Return the cached address/url, rebuilding them if the endpoint changed."""
+        endpoint = self._endpoint
+        if endpoint is None or endpoint[0] != self.ip_address or endpoint[1] != self.port:
+            address = f"{self.ip_address}:{self.port}"
+            endpoint = (self.ip_address, self.port, address, f"http://{address}")
+            self._endpoint = endpoint
+        return endpoint
 
     def has_capability(self, capability: str) -> bool:
         """Check if node has a specific capability."""
         return capability in self.capabilities
 
 
+# Last (epoch seconds, ISO string) pair; a health-check pass stamps every
+# node it reaches with the same time, so this saves reformatting it.
+_last_formatted: Tuple[float, str] = (-1.0, "")
+
+
+def _format_timestamp(seconds: float) -> str:
+    """Convert epoch seconds to the ISO-8601 UTC form used on the wire."""
+    global _last_formatted
+    cached = _last_formatted
+    if cached[0] != seconds:
+        cached = (seconds, datetime.fromtimestamp(seconds, timezone.utc).isoformat())
+        _last_formatted = cached
+    return cached[1]
+
+
+def _parse_timestamp(value: str) -> Optional[float]:
+    """Convert an ISO-8601 timestamp to epoch seconds, or None if invalid."""
+    try:
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except (AttributeError, ValueError):
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.timestamp()
+
+
 def generate_node_id() -> str:
     """Generate a unique node ID."""
     return str(uuid.uuid4())[:8]
@@ -3,14 +3,43 @@
 from __future__ import annotations
 
 import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from datetime import datetime, timezone
 from enum import Enum
-from typing import Any, Dict, List, Optional
-from urllib.error import HTTPError, URLError
-from urllib.request import Request, urlopen
+from http.client import HTTPConnection, HTTPSConnection, RemoteDisconnected
+from typing import Any, Dict, List, Optional, Tuple, Union
+from urllib.error import HTTPError
+from urllib.parse import urlsplit
 
-from .node import NodeInfo
+from .node import NodeInfo, _format_timestamp, _parse_timestamp
+
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json is the fallback
+    orjson = None  # type: ignore[assignment]
+
+# Upper bound on concurrent requests when fanning out to many peers.
+MAX_FANOUT_WORKERS = 32
+
+# Idle keep-alive connections retained per peer.
+MAX_IDLE_CONNECTIONS = 4
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Errors that mean a pooled keep-alive connection was closed by the peer.
+_STALE_CONNECTION_ERRORS = (RemoteDisconnected, ConnectionResetError, BrokenPipeError)
+
+_PeerKey = Tuple[str, str, Optional[int]]
+
+
+def _loads(data: Union[str, bytes]) -> Any:
+    """Parse JSON text or UTF-8 bytes, preferring orjson when installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
 
 
 class MessageType(str, Enum):
@@ -24,7 +53,12 @@ class MessageType(str, Enum):
     ERROR = "error"
 
 
-@dataclass
+# Messages that are safe to resend even if the peer may already have
+# processed them.
+_IDEMPOTENT_MESSAGES = frozenset({MessageType.PING, MessageType.ANNOUNCE})
+
+
+@dataclass(slots=True)
 class MeshMessage:
     """A message exchanged between mesh nodes."""
 
@@ -32,13 +66,13 @@ class MeshMessage:
     source_node: str
     target_node: Optional[str] = None
     payload: Dict[str, Any] = field(default_factory=dict)
-    timestamp: str = field(default_factory=lambda: datetime.now(timezone.utc).isoformat())
+    # Epoch seconds; formatted as ISO-8601 only when serialized.
+    timestamp: float = field(default_factory=time.time)
     message_id: str = ""
 
     def __post_init__(self):
         if not self.message_id:
-            import uuid
-            self.message_id = str(uuid.uuid4())[:12]
+            self.message_id = os.urandom(6).hex()
 
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -46,12 +80,18 @@ class MeshMessage:
             "source_node": self.source_node,
             "target_node": self.target_node,
             "payload": self.payload,
-            "timestamp": self.timestamp,
+            "timestamp": _format_timestamp(self.timestamp),
             "message_id": self.message_id,
         }
 
     def to_json(self) -> str:
-        return json.dumps(self.to_dict())
+        return self.to_bytes().decode("utf-8")
+
+    def to_bytes(self) -> bytes:
+        """Serialize to UTF-8 encoded JSON for the wire."""
+        if orjson is not None:
+            return orjson.dumps(self.to_dict())
+        return json.dumps(self.to_dict()).encode("utf-8")
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "MeshMessage":
@@ -60,16 +100,17 @@ class MeshMessage:
             source_node=data["source_node"],
             target_node=data.get("target_node"),
             payload=data.get("payload", {}),
-            timestamp=data.get("timestamp", ""),
+            # Fall back to the receive time for missing or malformed stamps.
+            timestamp=_parse_timestamp(data.get("timestamp", "")) or time.time(),
             message_id=data.get("message_id", ""),
         )
 
     @classmethod
-    def from_json(cls, json_str: str) -> "MeshMessage":
-        return cls.from_dict(json.loads(json_str))
+    def from_json(cls, json_str: Union[str, bytes]) -> "MeshMessage":
+        return cls.from_dict(_loads(json_str))
 
 
-@dataclass
+@dataclass(slots=True)
 class PingRequest:
     """Request to check if a node is alive."""
     source_node: str
@@ -83,7 +124,7 @@ class PingRequest:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class PongResponse:
     """Response to a ping request."""
     node_info: NodeInfo
@@ -101,7 +142,7 @@ class PongResponse:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class NodeAnnouncement:
     """Announcement of node presence on the mesh."""
     node_info: NodeInfo
@@ -114,12 +155,59 @@ class NodeAnnouncement:
         )
 
 
+class _ConnectionPool:
+    """Thread-safe pool of keep-alive HTTP connections keyed by peer."""
+
+    def __init__(self, timeout: float, max_idle: int = MAX_IDLE_CONNECTIONS):
+        self.timeout = timeout
+        self.max_idle = max_idle
+        self._idle: Dict[_PeerKey, List[HTTPConnection]] = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, key: _PeerKey) -> Tuple[HTTPConnection, bool]:
+        """Return an idle connection for ``key`` (reused=True) or a new one."""
+        with self._lock:
+            idle = self._idle.get(key)
+            if idle:
+                return idle.pop(), True
+
+        scheme, host, port = key
+        connection_cls = HTTPSConnection if scheme == "https" else HTTPConnection
+        return connection_cls(host, port, timeout=self.timeout), False
+
+    def release(self, key: _PeerKey, connection: HTTPConnection) -> None:
+        """Return a connection whose response has been fully read."""
+        with self._lock:
+            idle = self._idle.setdefault(key, [])
+            if len(idle) < self.max_idle:
+                idle.append(connection)
+                return
+        connection.close()
+
+    def close(self) -> None:
+        """Close every idle connection."""
+        with self._lock:
+            connections = [conn for idle in self._idle.values() for conn in idle]
+            self._idle.clear()
+        for connection in connections:
+            connection.close()
+
+
 class MeshProtocol:
-    """Protocol handler for mesh communication."""
+    """Protocol handler for mesh communication.
+
+    Messages are posted over keep-alive HTTP connections that are pooled per
+    peer, so repeated pings and announcements skip the TCP handshake.
+    """
 
     def __init__(self, local_node: NodeInfo, timeout: float = 5.0):
         self.local_node = local_node
         self.timeout = timeout
+        self._pool = _ConnectionPool(timeout)
+
+    def close(self) -> None:
+        """Close pooled connections to peers."""
+        self._pool.close()
 
     def ping(self, target: NodeInfo) -> Optional[PongResponse]:
         """Send a ping to a target node and wait for response."""
@@ -144,20 +232,49 @@ class MeshProtocol:
 
         return None
 
+    def ping_many(self, targets: List[NodeInfo]) -> Dict[str, PongResponse]:
+        """Ping several nodes concurrently.
+
+        Returns the responses keyed by target node id; targets that did not
+        answer are absent.
+        """
+        if not targets:
+            return {}
+        if len(targets) == 1:
+            response = self.ping(targets[0])
+            return {targets[0].node_id: response} if response else {}
+
+        workers = min(MAX_FANOUT_WORKERS, len(targets))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="mesh-ping") as executor:
+            responses = list(executor.map(self.ping, targets))
+
+        return {
+            target.node_id: response
+            for target, response in zip(targets, responses)
+            if response is not None
+        }
+
     def announce(self, targets: List[NodeInfo]) -> int:
-        """Announce presence to multiple nodes."""
+        """Announce presence to multiple nodes.
+
+        Announcements are sent concurrently, so the call takes roughly as
+        long as the slowest target rather than the sum of all of them.
+        """
+        if not targets:
+            return 0
+
         announcement = NodeAnnouncement(node_info=self.local_node)
-        message = announcement.to_message()
+        # Every target receives the same message, so serialize it once.
+        data = announcement.to_message().to_bytes()
 
-        successful = 0
-        for target in targets:
-            try:
-                self._send_message(target.url, message, expect_response=False)
-                successful += 1
-            except Exception:
-                continue
+        workers = min(MAX_FANOUT_WORKERS, len(targets))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="mesh-announce") as executor:
+            futures = [
+                executor.submit(self._send_bytes, target.url, data, False)
+                for target in targets
+            ]
 
-        return successful
+        return sum(1 for future in futures if future.exception() is None)
 
     def send_request(
         self,
@@ -188,26 +305,69 @@ class MeshProtocol:
         expect_response: bool = True,
     ) -> Optional[MeshMessage]:
         """Send a message to a node's mesh endpoint."""
-        endpoint = f"{url.rstrip('/')}/mesh/message"
-        data = message.to_json().encode("utf-8")
-
-        req = Request(
-            endpoint,
-            data=data,
-            headers={"Content-Type": "application/json"},
-            method="POST",
+        return self._send_bytes(url, message.to_bytes(), expect_response)
+
+    def _send_bytes(
+        self,
+        url: str,
+        data: bytes,
+        expect_response: bool = True,
+    ) -> Optional[MeshMessage]:
+        """Send an already serialized message to a node's mesh endpoint."""
+        parts = urlsplit(url)
+        key: _PeerKey = (parts.scheme or "http", parts.hostname or "", parts.port)
+        path = f"{parts.path.rstrip('/')}/mesh/message"
+
+        status, reason, headers, body = self._post(
+            key, path, data, idempotent=message.type in _IDEMPOTENT_MESSAGES
         )
 
-        try:
-            with urlopen(req, timeout=self.timeout) as resp:
-                if expect_response and resp.status == 200:
-                    response_data = resp.read().decode("utf-8")
-                    return MeshMessage.from_json(response_data)
-        except (HTTPError, URLError):
-            raise
+        if status >= 400:
+            raise HTTPError(f"{url.rstrip('/')}/mesh/message", status, reason, headers, None)
+
+        if expect_response and status == 200:
+            return MeshMessage.from_json(body)
 
         return None
 
+    def _post(
+        self,
+        key: _PeerKey,
+        path: str,
+        data: bytes,
+        idempotent: bool,
+    ) -> Tuple[int, str, Any, bytes]:
+        """POST ``data`` over a pooled connection and read the full response.
+
+        A reused connection the peer has since closed is retried on a fresh
+        connection if sending failed. Once the request is out the peer may
+        have acted on it, so a lost response is only retried for
+        ``idempotent`` messages.
+        """
+        while True:
+            connection, reused = self._pool.acquire(key)
+            sent = False
+            try:
+                connection.request("POST", path, body=data, headers=_JSON_HEADERS)
+                sent = True
+                response = connection.getresponse()
+                body = response.read()
+            except _STALE_CONNECTION_ERRORS:
+                connection.close()
+                if reused and (idempotent or not sent):
+                    continue
+                raise
+            except Exception:
+                connection.close()
+                raise
+
+            if response.will_close:
+                connection.close()
+            else:
+                self._pool.release(key, connection)
+
+            return response.status, response.reason, response.headers, body
+
 
 __all__ = [
     "MessageType",
@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+import hashlib
 import logging
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import List, Optional, Tuple
+
+import numpy as np
 
 logger = logging.getLogger("ember.rag.embeddings")
 
@@ -13,21 +16,34 @@ class EmbeddingModel(ABC):
     """Abstract base class for embedding models."""
 
     @abstractmethod
-    def embed(self, text: str) -> List[float]:
-        """Generate embedding for a single text."""
+    def embed(self, text: str) -> np.ndarray:
+        """Generate a float32 embedding of shape ``(dimension,)`` for a single text."""
         pass
 
     @abstractmethod
-    def embed_batch(self, texts: List[str]) -> List[List[float]]:
-        """Generate embeddings for multiple texts."""
+    def embed_batch(self, texts: List[str]) -> np.ndarray:
+        """Generate float32 embeddings of shape ``(len(texts), dimension)``."""
         pass
 
+    def embed_batch_int8(self, texts: List[str]) -> Tuple[np.ndarray, np.ndarray]:
+        """Generate int8-quantized embeddings for multiple texts.
+
+        Returns ``(codes, scales)`` where ``codes`` is int8 of shape
+        ``(N, dimension)`` and ``scales`` is float32 of shape ``(N,)``.
+        """
+        return quantize_int8(self.embed_batch(texts))
+
     @property
     @abstractmethod
     def dimension(self) -> int:
         """Return the embedding dimension."""
         pass
 
+    @property
+    def name(self) -> str:
+        """Identify the model, e.g. to key cached embeddings."""
+        return f"{type(self).__name__}:{self.dimension}"
+
 
 class SentenceTransformerEmbedding(EmbeddingModel):
     """Embedding model using sentence-transformers library."""
@@ -46,6 +62,10 @@ class SentenceTransformerEmbedding(EmbeddingModel):
             from sentence_transformers import SentenceTransformer
             logger.info("Loading embedding model: %s", self.model_name)
             self._model = SentenceTransformer(self.model_name)
+            # Half precision halves weight memory and bandwidth on GPUs; CPU
+            # FP16 kernels are slower than FP32, so leave CPU models alone.
+            if self._model.device.type == "cuda":
+                self._model.half()
             self._dimension = self._model.get_sentence_embedding_dimension()
             logger.info("Embedding model loaded (dim=%d)", self._dimension)
         except ImportError as e:
@@ -55,17 +75,17 @@ class SentenceTransformerEmbedding(EmbeddingModel):
                 f"(Error: {e})"
             )
 
-    def embed(self, text: str) -> List[float]:
+    def embed(self, text: str) -> np.ndarray:
         """Generate embedding for a single text."""
         self._ensure_model()
         embedding = self._model.encode(text, convert_to_numpy=True)
-        return embedding.tolist()
+        return embedding.astype(np.float32, copy=False)
 
-    def embed_batch(self, texts: List[str]) -> List[List[float]]:
+    def embed_batch(self, texts: List[str]) -> np.ndarray:
         """Generate embeddings for multiple texts."""
         self._ensure_model()
         embeddings = self._model.encode(texts, convert_to_numpy=True)
-        return [e.tolist() for e in embeddings]
+        return embeddings.astype(np.float32, copy=False)
 
     @property
     def dimension(self) -> int:
@@ -73,6 +93,11 @@ class SentenceTransformerEmbedding(EmbeddingModel):
         self._ensure_model()
         return self._dimension or 384  # Default for MiniLM
 
+    @property
+    def name(self) -> str:
+        """Identify the model, e.g. to key cached embeddings."""
+        return f"sentence-transformers:{self.model_name}"
+
 
 class SimpleHashEmbedding(EmbeddingModel):
     """Simple hash-based embedding for testing when sentence-transformers is unavailable.
@@ -82,31 +107,34 @@ class SimpleHashEmbedding(EmbeddingModel):
 
     def __init__(self, dimension: int = 384):
         self._dimension = dimension
+        # Positions into the 32-byte digest and per-position offsets are fixed
+        # for a given dimension, so compute them once.
+        self._gather = np.arange(dimension, dtype=np.intp) % hashlib.sha256().digest_size
+        self._offsets = np.arange(dimension, dtype=np.float32)
 
-    def embed(self, text: str) -> List[float]:
+    def embed(self, text: str) -> np.ndarray:
         """Generate a simple hash-based embedding."""
-        import hashlib
+        return self.embed_batch([text])[0]
 
-        # Create a deterministic but pseudo-random embedding from text hash
-        hash_bytes = hashlib.sha256(text.encode()).digest()
-
-        # Expand hash to fill dimension
-        embedding = []
-        for i in range(self._dimension):
-            byte_idx = i % len(hash_bytes)
-            value = (hash_bytes[byte_idx] + i) / 255.0 - 0.5
-            embedding.append(value)
+    def embed_batch(self, texts: List[str]) -> np.ndarray:
+        """Generate embeddings for multiple texts."""
+        # Create a deterministic but pseudo-random embedding from each text hash
+        digests = np.empty((len(texts), hashlib.sha256().digest_size), dtype=np.uint8)
+        for row, text in zip(digests, texts):
+            row[:] = np.frombuffer(hashlib.sha256(text.encode()).digest(), dtype=np.uint8)
 
-        # Normalize
-        norm = sum(v * v for v in embedding) ** 0.5
-        if norm > 0:
-            embedding = [v / norm for v in embedding]
+        # Expand hashes to fill dimension
+        embeddings = digests[:, self._gather].astype(np.float32)
+        embeddings += self._offsets
+        embeddings /= 255.0
+        embeddings -= 0.5
 
-        return embedding
+        # Normalize rows, leaving all-zero rows untouched
+        norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        embeddings /= norms
 
-    def embed_batch(self, texts: List[str]) -> List[List[float]]:
-        """Generate embeddings for multiple texts."""
-        return [self.embed(text) for text in texts]
+        return embeddings
 
     @property
     def dimension(self) -> int:
@@ -114,6 +142,24 @@ class SimpleHashEmbedding(EmbeddingModel):
         return self._dimension
 
 
+def quantize_int8(embeddings: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Quantize float embeddings to int8 codes with a per-vector scale.
+
+    Each row is scaled so its largest magnitude maps to 127; multiplying the
+    codes by ``scales[:, None]`` approximately recovers the input.
+    """
+    embeddings = np.atleast_2d(np.asarray(embeddings, dtype=np.float32))
+    scales = np.abs(embeddings).max(axis=1) / 127.0
+    divisors = np.where(scales > 0, scales, 1.0).astype(np.float32)
+    codes = np.rint(embeddings / divisors[:, None]).astype(np.int8)
+    return codes, scales.astype(np.float32)
+
+
+def dequantize_int8(codes: np.ndarray, scales: np.ndarray) -> np.ndarray:
+    """Reconstruct float32 embeddings from :func:`quantize_int8` output."""
+    return codes.astype(np.float32) * np.asarray(scales, dtype=np.float32)[:, None]
+
+
 def get_embedding_model(model_name: str = "all-MiniLM-L6-v2") -> EmbeddingModel:
     """Get an embedding model instance.
 
@@ -134,4 +180,6 @@ __all__ = [
     "SentenceTransformerEmbedding",
     "SimpleHashEmbedding",
     "get_embedding_model",
+    "quantize_int8",
+    "dequantize_int8",
 ]
@@ -4,18 +4,31 @@ from __future__ import annotations
 
 import hashlib
 import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Sequence
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Set, Tuple
+
+import numpy as np
 
 from .embeddings import EmbeddingModel, get_embedding_model
-from .store import Document, VectorStore
+from .store import Document, VectorStore, content_hash
 
 logger = logging.getLogger("ember.rag.indexer")
 
 # Supported file extensions for indexing
 SUPPORTED_EXTENSIONS = {".md", ".markdown", ".txt", ".rst"}
 
+# Threads reading and chunking files in parallel during index_directory
+MAX_READ_WORKERS = 8
+
+# Files read ahead per worker before their chunks are consumed
+READ_AHEAD_FACTOR = 4
+
+# Chunks embedded and written to the store together during index_directory
+INSERT_BATCH_SIZE = 256
+
 
 @dataclass
 class ChunkConfig:
@@ -62,13 +75,18 @@ class RAGIndexer:
         directory: Path,
         extensions: Optional[Sequence[str]] = None,
         recursive: bool = True,
+        force: bool = False,
     ) -> IndexStats:
         """Index all supported files in a directory.
 
+        Files whose modification time and size match the last indexing run
+        are skipped unless ``force`` is set.
+
         Args:
             directory: Path to directory to index
             extensions: File extensions to include (default: SUPPORTED_EXTENSIONS)
             recursive: Whether to search recursively
+            force: Re-index files even if they are unchanged
 
         Returns:
             IndexStats with results
@@ -81,36 +99,41 @@ class RAGIndexer:
             return stats
 
         # Find all matching files
-        if recursive:
-            files = [
-                f for f in directory.rglob("*")
-                if f.is_file() and f.suffix.lower() in exts
-            ]
-        else:
-            files = [
-                f for f in directory.iterdir()
-                if f.is_file() and f.suffix.lower() in exts
-            ]
+        files = [Path(path) for path in _iter_files(directory, exts, recursive)]
 
         logger.info("Found %d files to index in %s", len(files), directory)
 
-        # Process files
-        all_documents: List[Document] = []
-
-        for file_path in files:
-            try:
-                docs = self._process_file(file_path)
-                all_documents.extend(docs)
-                stats.files_processed += 1
-                stats.chunks_created += len(docs)
-            except Exception as e:
-                logger.error("Error processing %s: %s", file_path, e)
-                stats.errors += 1
-
-        # Generate embeddings in batches
-        if all_documents:
-            self._add_embeddings(all_documents)
-            self.store.add_documents(all_documents)
+        files, file_states = self._changed_files(files, force, stats)
+
+        # Process files, overlapping reads across a small thread pool and
+        # writing chunks out in batches so memory does not grow with the vault
+        pending: List[Document] = []
+        indexed_states: Dict[str, Tuple[int, int]] = {}
+
+        if files:
+            workers = min(MAX_READ_WORKERS, len(files))
+            read_ahead = workers * READ_AHEAD_FACTOR
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="rag-read") as executor:
+                for start in range(0, len(files), read_ahead):
+                    batch = files[start : start + read_ahead]
+                    outcomes = executor.map(self._try_process_file, batch)
+                    for file_path, (docs, error) in zip(batch, outcomes):
+                        if error is not None:
+                            logger.error("Error processing %s: %s", file_path, error)
+                            stats.errors += 1
+                            continue
+                        pending.extend(docs)
+                        indexed_states[str(file_path)] = file_states[file_path]
+                        stats.files_processed += 1
+                        stats.chunks_created += len(docs)
+
+                        if len(pending) >= INSERT_BATCH_SIZE:
+                            self._write_batch(pending, indexed_states)
+                            pending = []
+                            indexed_states = {}
+
+        if indexed_states:
+            self._write_batch(pending, indexed_states)
 
         logger.info(
             "Indexed %d files, %d chunks from %s",
@@ -121,6 +144,15 @@ class RAGIndexer:
 
         return stats
 
+    def _write_batch(self, docs: List[Document], states: Dict[str, Tuple[int, int]]) -> None:
+        """Embed ``docs`` and replace every chunk stored for the files in ``states``."""
+        if docs:
+            self._add_embeddings(docs)
+        self.store.delete_by_sources(list(states))
+        if docs:
+            self.store.add_documents(docs)
+        self.store.record_sources(states)
+
     def index_file(self, file_path: Path) -> IndexStats:
         """Index a single file.
 
@@ -138,6 +170,7 @@ class RAGIndexer:
 
         try:
             docs = self._process_file(file_path)
+            self.store.delete_by_source(str(file_path))
             if docs:
                 self._add_embeddings(docs)
                 self.store.add_documents(docs)
@@ -149,6 +182,41 @@ class RAGIndexer:
 
         return stats
 
+    def _changed_files(
+        self,
+        files: List[Path],
+        force: bool,
+        stats: IndexStats,
+    ) -> Tuple[List[Path], Dict[Path, Tuple[int, int]]]:
+        """Drop files unchanged since they were last indexed.
+
+        Returns the files still to index with their current
+        ``(mtime_ns, size)``; skipped files are counted in ``stats``.
+        """
+        file_states: Dict[Path, Tuple[int, int]] = {}
+        for file_path in files:
+            try:
+                stat = file_path.stat()
+            except OSError:
+                file_states[file_path] = (0, -1)  # left for _process_file to report
+                continue
+            file_states[file_path] = (stat.st_mtime_ns, stat.st_size)
+
+        if force:
+            return files, file_states
+
+        known = self.store.get_source_states([str(f) for f in files])
+        changed = [f for f in files if known.get(str(f)) != file_states[f]]
+        stats.skipped += len(files) - len(changed)
+        return changed, file_states
+
+    def _try_process_file(self, file_path: Path) -> Tuple[List[Document], Optional[Exception]]:
+        """Run _process_file, returning the error instead of raising it."""
+        try:
+            return self._process_file(file_path), None
+        except Exception as e:
+            return [], e
+
     def _process_file(self, file_path: Path) -> List[Document]:
         """Process a file and return document chunks."""
         try:
@@ -210,28 +278,8 @@ class RAGIndexer:
                     current_chunk = []
                     current_length = 0
 
-                # Split large paragraph into sentences/words
-                words = para.split()
-                word_chunk = []
-                word_length = 0
-
-                for word in words:
-                    if word_length + len(word) + 1 > config.chunk_size and word_chunk:
-                        chunks.append(" ".join(word_chunk))
-                        # Keep overlap
-                        overlap_words = int(config.chunk_overlap / 5)  # ~5 chars per word
-                        word_chunk = word_chunk[-overlap_words:] if overlap_words > 0 else []
-                        word_length = sum(len(w) + 1 for w in word_chunk)
-
-                    word_chunk.append(word)
-                    word_length += len(word) + 1
-
-                if word_chunk:
-                    if current_chunk:
-                        current_chunk.append(" ".join(word_chunk))
-                        current_length += word_length
-                    else:
-                        chunks.append(" ".join(word_chunk))
+                # Split large paragraph into words
+                chunks.extend(self._split_words(para.split()))
 
             elif current_length + para_length > config.chunk_size and current_chunk:
                 # Flush current chunk
@@ -253,22 +301,81 @@ class RAGIndexer:
 
         return chunks
 
+    def _split_words(self, words: List[str]) -> List[str]:
+        """Greedily pack words into chunks of at most chunk_size characters.
+
+        Each chunk after the first starts with the last few words of the
+        previous one for overlap, and always takes at least one new word.
+        Chunk ends are found by binary search over the cumulative word
+        lengths (each word counts one separator).
+        """
+        config = self.chunk_config
+        overlap_words = int(config.chunk_overlap / 5)  # ~5 chars per word
+
+        lengths = np.fromiter((len(w) + 1 for w in words), dtype=np.int64, count=len(words))
+        cumulative = np.zeros(len(words) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=cumulative[1:])
+
+        chunks = []
+        start = 0
+        min_end = 1
+        while True:
+            # First word that no longer fits after words[start:]
+            end = int(np.searchsorted(cumulative, cumulative[start] + config.chunk_size, side="right")) - 1
+            end = max(end, min_end)
+            if end >= len(words):
+                chunks.append(" ".join(words[start:]))
+                return chunks
+
+            chunks.append(" ".join(words[start:end]))
+            start = max(start, end - overlap_words) if overlap_words > 0 else end
+            min_end = end + 1
+
     def _add_embeddings(self, documents: List[Document]) -> None:
-        """Add embeddings to documents in batches."""
+        """Add embeddings to documents in batches.
+
+        Chunks whose text was embedded before by the same model reuse the
+        embedding cached in the store; only new text is embedded.
+        """
         batch_size = 32
-        texts = [doc.content for doc in documents]
+        model_name = self.embedding_model.name
+        hashes = [content_hash(doc.content) for doc in documents]
+        embeddings = self.store.get_cached_embeddings(model_name, hashes)
+
+        # Unique uncached texts, keyed by hash
+        pending: Dict[str, str] = {}
+        for doc, digest in zip(documents, hashes):
+            if digest not in embeddings and digest not in pending:
+                pending[digest] = doc.content
+
+        pending_hashes = list(pending)
+        texts = list(pending.values())
+        fresh: Dict[str, Any] = {}
 
         for i in range(0, len(texts), batch_size):
             batch_texts = texts[i : i + batch_size]
             batch_embeddings = self.embedding_model.embed_batch(batch_texts)
 
-            for j, embedding in enumerate(batch_embeddings):
-                documents[i + j].embedding = embedding
+            for digest, embedding in zip(pending_hashes[i : i + batch_size], batch_embeddings):
+                fresh[digest] = embedding
+
+        if fresh:
+            self.store.cache_embeddings(model_name, fresh)
+            embeddings.update(fresh)
+
+        logger.debug(
+            "Embedded %d chunks, %d from cache",
+            len(documents),
+            len(documents) - len(texts),
+        )
+
+        for doc, digest in zip(documents, hashes):
+            doc.embedding = embeddings[digest]
 
     def _generate_id(self, file_path: Path, chunk_index: int) -> str:
         """Generate a unique ID for a document chunk."""
         source = f"{file_path}:{chunk_index}"
-        return hashlib.sha256(source.encode()).hexdigest()[:16]
+        return hashlib.blake2b(source.encode(), digest_size=8).hexdigest()
 
     def reindex_all(self, directories: List[Path]) -> IndexStats:
         """Clear the store and reindex all directories."""
@@ -282,7 +389,32 @@ class RAGIndexer:
             total_stats.errors += stats.errors
             total_stats.skipped += stats.skipped
 
+        self.store.prune_embedding_cache()
         return total_stats
 
 
+def _iter_files(directory: Path, exts: Set[str], recursive: bool) -> Iterator[str]:
+    """Yield paths of files under ``directory`` whose suffix is in ``exts``.
+
+    Walks with ``os.scandir`` so directory entries answer ``is_file``/``is_dir``
+    from the listing itself. Symlinked directories are not descended into;
+    unreadable directories are skipped.
+    """
+    pending = [os.fspath(directory)]
+    while pending:
+        try:
+            with os.scandir(pending.pop()) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_file():
+                            if os.path.splitext(entry.name)[1].lower() in exts:
+                                yield entry.path
+                        elif recursive and entry.is_dir(follow_symlinks=False):
+                            pending.append(entry.path)
+                    except OSError:
+                        continue
+        except OSError as e:
+            logger.debug("Skipping unreadable directory: %s", e)
+
+
 __all__ = ["RAGIndexer", "ChunkConfig", "IndexStats"]
@@ -3,15 +3,21 @@
 from __future__ import annotations
 
 import logging
+from collections import OrderedDict
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+import numpy as np
+
 from .embeddings import EmbeddingModel, get_embedding_model
 from .store import Document, VectorStore
 
 logger = logging.getLogger("ember.rag.retriever")
 
+# Most recent query texts whose embeddings are kept per retriever.
+QUERY_CACHE_SIZE = 256
+
 
 @dataclass
 class RetrievalResult:
@@ -43,6 +49,7 @@ class RAGRetriever:
         self.embedding_model = embedding_model or get_embedding_model()
         self.default_top_k = default_top_k
         self.score_threshold = score_threshold
+        self._query_cache: "OrderedDict[str, np.ndarray]" = OrderedDict()
 
     def query(
         self,
@@ -66,7 +73,7 @@ class RAGRetriever:
         k = top_k or self.default_top_k
 
         # Generate query embedding
-        query_embedding = self.embedding_model.embed(query_text)
+        query_embedding = self._embed_query(query_text)
 
         # Search the store
         results = self.store.search(
@@ -90,6 +97,20 @@ class RAGRetriever:
 
         return retrieval_results
 
+    def _embed_query(self, query_text: str) -> np.ndarray:
+        """Embed a query, reusing the embedding of recently seen identical text."""
+        cache = self._query_cache
+        embedding = cache.get(query_text)
+        if embedding is not None:
+            cache.move_to_end(query_text)
+            return embedding
+
+        embedding = self.embedding_model.embed(query_text)
+        cache[query_text] = embedding
+        if len(cache) > QUERY_CACHE_SIZE:
+            cache.popitem(last=False)
+        return embedding
+
     def get_context_for_prompt(
         self,
         query_text: str,
@@ -2,16 +2,43 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
+import os
 import sqlite3
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
-import math
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from .embeddings import dequantize_int8, quantize_int8
 
 logger = logging.getLogger("ember.rag.store")
 
+# Embeddings are stored as raw little-endian float32 bytes.
+_EMBED_DTYPE = np.dtype("<f4")
+
+_CONNECTION_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-65536",  # 64 MiB page cache
+    "PRAGMA mmap_size=268435456",  # 256 MiB
+    # INSERT OR REPLACE must fire the delete trigger that keeps the source
+    # index in sync
+    "PRAGMA recursive_triggers=ON",
+)
+
+# Host parameters per IN (...) query, below SQLite's default limit of 999.
+_SQL_BATCH_SIZE = 500
+
+# Sidecar files next to the database holding the normalized search matrix
+# (memory-mapped on load) and its row ids, tagged with the documents version.
+_MATRIX_SUFFIX = ".matrix.npy"
+_MATRIX_IDS_SUFFIX = ".matrix.ids"
+
 
 @dataclass
 class Document:
@@ -21,7 +48,7 @@ class Document:
     content: str
     source: str
     metadata: Dict[str, Any] = field(default_factory=dict)
-    embedding: Optional[List[float]] = None
+    embedding: Optional[np.ndarray] = None
 
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -35,13 +62,23 @@ class Document:
 class VectorStore:
     """SQLite-based vector store with cosine similarity search.
 
-    Uses pure Python for vector operations when sqlite-vss is not available.
+    Uses NumPy for vector operations when sqlite-vss is not available.
     """
 
-    def __init__(self, db_path: Path):
+    def __init__(self, db_path: Path, quantize: bool = False):
         self.db_path = db_path
+        # Write new embeddings as int8 codes with a per-vector scale (a quarter
+        # of the float32 size); stores may mix both encodings.
+        self.quantize = quantize
         self._conn: Optional[sqlite3.Connection] = None
         self._has_vss = False
+        # Whether documents_source_fts (an FTS5 trigram index) is available
+        self._has_source_index = False
+        # Every stored embedding, unit-normalized and stacked as an (N, d)
+        # float32 matrix with its ids; built on first search, dropped on writes.
+        self._matrix: Optional[np.ndarray] = None
+        self._ids: List[str] = []
+        self._id_rows: Dict[str, int] = {}
 
     def initialize(self) -> None:
         """Initialize the database and tables."""
@@ -49,6 +86,11 @@ class VectorStore:
         self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
         self._conn.row_factory = sqlite3.Row
 
+        # WAL with NORMAL sync only fsyncs at checkpoints; the index can be
+        # rebuilt from the vault, so it does not need full durability.
+        for pragma in _CONNECTION_PRAGMAS:
+            self._conn.execute(pragma)
+
         # Try to load sqlite-vss extension
         try:
             self._conn.enable_load_extension(True)
@@ -77,13 +119,109 @@ class VectorStore:
             )
         """)
 
+        # Per-vector scale for int8-quantized embeddings; NULL for float32
+        columns = {row[1] for row in cursor.execute("PRAGMA table_info(documents)")}
+        if "embedding_scale" not in columns:
+            cursor.execute("ALTER TABLE documents ADD COLUMN embedding_scale REAL")
+
+        # Hash of each chunk's text, matching the embedding_cache keys
+        if "content_hash" not in columns:
+            cursor.execute("ALTER TABLE documents ADD COLUMN content_hash TEXT")
+            rows = cursor.execute("SELECT id, content FROM documents").fetchall()
+            cursor.executemany(
+                "UPDATE documents SET content_hash = ? WHERE id = ?",
+                [(content_hash(content), doc_id) for doc_id, content in rows],
+            )
+
         # Index for source lookups
         cursor.execute("""
             CREATE INDEX IF NOT EXISTS idx_documents_source ON documents(source)
         """)
 
+        self._has_source_index = self._create_source_index(cursor)
+
+        # File state (mtime, size) at the time each source was last indexed
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS sources (
+                path TEXT PRIMARY KEY,
+                mtime_ns INTEGER NOT NULL,
+                size INTEGER NOT NULL
+            )
+        """)
+
+        # Random token replaced on every documents write, used to tell whether
+        # the sidecar search matrix is still current
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS store_meta (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL
+            )
+        """)
+        cursor.execute(
+            "INSERT OR IGNORE INTO store_meta (key, value) VALUES ('documents_version', ?)",
+            (os.urandom(8).hex(),),
+        )
+
+        # Embeddings by model and chunk-content hash; survives clear() so a
+        # reindex only embeds chunks whose text changed, and is trimmed to
+        # the stored documents by prune_embedding_cache()
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS embedding_cache (
+                model TEXT NOT NULL,
+                hash TEXT NOT NULL,
+                embedding BLOB NOT NULL,
+                PRIMARY KEY (model, hash)
+            )
+        """)
+
         self._conn.commit()
 
+    def _create_source_index(self, cursor: sqlite3.Cursor) -> bool:
+        """Create the trigram index that serves substring source filters.
+
+        Returns False when this SQLite build lacks FTS5 or the trigram
+        tokenizer, in which case filters fall back to a LIKE scan.
+        """
+        cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'documents_source_fts'"
+        )
+        exists = cursor.fetchone() is not None
+
+        try:
+            cursor.execute("""
+                CREATE VIRTUAL TABLE IF NOT EXISTS documents_source_fts USING fts5(
+                    source, content='documents', content_rowid='rowid', tokenize='trigram'
+                )
+            """)
+        except sqlite3.OperationalError as exc:
+            logger.info("FTS5 trigram index not available, source filters will scan: %s", exc)
+            return False
+
+        cursor.executescript("""
+            CREATE TRIGGER IF NOT EXISTS documents_source_fts_insert
+            AFTER INSERT ON documents BEGIN
+                INSERT INTO documents_source_fts (rowid, source) VALUES (new.rowid, new.source);
+            END;
+            CREATE TRIGGER IF NOT EXISTS documents_source_fts_delete
+            AFTER DELETE ON documents BEGIN
+                INSERT INTO documents_source_fts (documents_source_fts, rowid, source)
+                VALUES ('delete', old.rowid, old.source);
+            END;
+            CREATE TRIGGER IF NOT EXISTS documents_source_fts_update
+            AFTER UPDATE OF source ON documents BEGIN
+                INSERT INTO documents_source_fts (documents_source_fts, rowid, source)
+                VALUES ('delete', old.rowid, old.source);
+                INSERT INTO documents_source_fts (rowid, source) VALUES (new.rowid, new.source);
+            END;
+        """)
+
+        if not exists:
+            # Index documents written before the index existed
+            cursor.execute(
+                "INSERT INTO documents_source_fts (documents_source_fts) VALUES ('rebuild')"
+            )
+        return True
+
     def add_document(self, doc: Document) -> None:
         """Add a document to the store."""
         if not self._conn:
@@ -91,20 +229,12 @@ class VectorStore:
 
         cursor = self._conn.cursor()
 
-        # Serialize embedding as JSON blob
-        embedding_blob = json.dumps(doc.embedding) if doc.embedding else None
-
         cursor.execute("""
-            INSERT OR REPLACE INTO documents (id, content, source, metadata, embedding)
-            VALUES (?, ?, ?, ?, ?)
-        """, (
-            doc.id,
-            doc.content,
-            doc.source,
-            json.dumps(doc.metadata),
-            embedding_blob,
-        ))
+            INSERT OR REPLACE INTO documents (id, content, source, metadata, embedding, embedding_scale, content_hash)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+        """, self._document_row(doc))
 
+        self._documents_changed(cursor)
         self._conn.commit()
 
     def add_documents(self, docs: List[Document]) -> None:
@@ -114,109 +244,327 @@ class VectorStore:
 
         cursor = self._conn.cursor()
 
-        data = [
-            (
-                doc.id,
-                doc.content,
-                doc.source,
-                json.dumps(doc.metadata),
-                json.dumps(doc.embedding) if doc.embedding else None,
-            )
-            for doc in docs
-        ]
+        data = [self._document_row(doc) for doc in docs]
 
         cursor.executemany("""
-            INSERT OR REPLACE INTO documents (id, content, source, metadata, embedding)
-            VALUES (?, ?, ?, ?, ?)
+            INSERT OR REPLACE INTO documents (id, content, source, metadata, embedding, embedding_scale, content_hash)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
         """, data)
 
+        self._documents_changed(cursor)
         self._conn.commit()
         logger.info("Added %d documents to store", len(docs))
 
+    def _document_row(self, doc: Document) -> Tuple[Any, ...]:
+        """Build the documents-table row for ``doc``."""
+        blob, scale = _encode_embedding(doc.embedding, self.quantize)
+        return (
+            doc.id, doc.content, doc.source, json.dumps(doc.metadata), blob, scale,
+            content_hash(doc.content),
+        )
+
     def search(
         self,
-        query_embedding: List[float],
+        query_embedding: np.ndarray,
         top_k: int = 5,
         source_filter: Optional[str] = None,
     ) -> List[Tuple[Document, float]]:
         """Search for similar documents using cosine similarity.
 
+        Scores every stored embedding with one matrix-vector product against
+        the in-memory matrix, then loads only the top_k rows from SQLite.
+
         Returns list of (document, similarity_score) tuples.
         """
         if not self._conn:
             raise RuntimeError("Store not initialized")
 
+        if self._matrix is None:
+            self._load_matrix()
+
+        query = np.asarray(query_embedding, dtype=np.float32)
+        matrix = self._matrix
+        if top_k <= 0 or not len(matrix) or query.shape != matrix.shape[1:]:
+            return []
+
         cursor = self._conn.cursor()
 
-        # Build query
+        rows: Optional[np.ndarray] = None
         if source_filter:
-            cursor.execute(
-                "SELECT id, content, source, metadata, embedding FROM documents WHERE source LIKE ?",
-                (f"%{source_filter}%",)
+            if self._has_source_index:
+                # The trigram index answers LIKE directly for patterns of
+                # three or more characters
+                cursor.execute(
+                    "SELECT d.id FROM documents_source_fts f "
+                    "JOIN documents d ON d.rowid = f.rowid WHERE f.source LIKE ?",
+                    (f"%{source_filter}%",)
+                )
+            else:
+                cursor.execute(
+                    "SELECT id FROM documents WHERE source LIKE ?",
+                    (f"%{source_filter}%",)
+                )
+            id_rows = self._id_rows
+            rows = np.fromiter(
+                (id_rows[doc_id] for (doc_id,) in cursor if doc_id in id_rows),
+                dtype=np.intp,
             )
+            if not len(rows):
+                return []
+            matrix = matrix[rows]
+
+        # Rows are unit length, so cosine similarity is a dot product with
+        # the normalized query
+        query_norm = float(np.linalg.norm(query))
+        if query_norm == 0:
+            scores = np.zeros(len(matrix), dtype=np.float32)
         else:
-            cursor.execute(
-                "SELECT id, content, source, metadata, embedding FROM documents WHERE embedding IS NOT NULL"
-            )
+            scores = matrix @ (query / query_norm)
 
-        results: List[Tuple[Document, float]] = []
+        # Partial sort: only the top_k candidates are ordered
+        k = min(top_k, len(scores))
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top], kind="stable")]
+        top_rows = rows[top] if rows is not None else top
 
-        for row in cursor.fetchall():
-            if not row["embedding"]:
-                continue
+        top_ids = [self._ids[row] for row in top_rows]
+        placeholders = ",".join("?" * len(top_ids))
+        cursor.execute(
+            f"SELECT id, content, source, metadata, embedding, embedding_scale "
+            f"FROM documents WHERE id IN ({placeholders})",
+            top_ids,
+        )
+        by_id = {row["id"]: row for row in cursor.fetchall()}
 
-            doc_embedding = json.loads(row["embedding"])
-            similarity = self._cosine_similarity(query_embedding, doc_embedding)
+        results: List[Tuple[Document, float]] = []
+        for doc_id, score in zip(top_ids, scores[top]):
+            row = by_id.get(doc_id)
+            if row is None:
+                continue
 
             doc = Document(
                 id=row["id"],
                 content=row["content"],
                 source=row["source"],
                 metadata=json.loads(row["metadata"]) if row["metadata"] else {},
-                embedding=doc_embedding,
+                # The stored vector, not the normalized search row
+                embedding=_decode_embedding(row["embedding"], row["embedding_scale"]),
+            )
+
+            results.append((doc, float(score)))
+
+        return results
+
+    def _load_matrix(self) -> None:
+        """Load the search matrix, preferring the sidecar files when current."""
+        version = self._documents_version()
+        if self._load_sidecar_matrix(version):
+            return
+
+        self._build_matrix()
+        self._save_sidecar_matrix(version)
+
+    def _build_matrix(self) -> None:
+        """Stack every stored embedding into the in-memory search matrix.
+
+        Rows are normalized to unit length once here so searches need no
+        per-row division; all-zero rows stay zero. Rows whose dimension
+        differs from the first embedding are skipped, since they could never
+        match a query of the other dimension.
+        """
+        cursor = self._conn.cursor()
+        cursor.execute(
+            "SELECT id, embedding, embedding_scale FROM documents WHERE embedding IS NOT NULL"
+        )
+
+        ids: List[str] = []
+        blobs: List[bytes] = []
+        for doc_id, blob, scale in cursor:
+            if not blob:
+                continue
+            if isinstance(blob, str) or scale is not None:
+                blob = _decode_embedding(blob, scale).tobytes()
+            if blobs and len(blob) != len(blobs[0]):
+                logger.debug("Skipping embedding with mismatched dimension: %s", doc_id)
+                continue
+            ids.append(doc_id)
+            blobs.append(blob)
+
+        if blobs:
+            dim = len(blobs[0]) // _EMBED_DTYPE.itemsize
+            matrix = np.frombuffer(bytearray().join(blobs), dtype=_EMBED_DTYPE).reshape(len(blobs), dim)
+            norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+            np.divide(matrix, norms, out=matrix, where=norms > 0)
+        else:
+            matrix = np.empty((0, 0), dtype=_EMBED_DTYPE)
+        self._set_matrix(matrix, ids)
+
+    def _set_matrix(self, matrix: np.ndarray, ids: List[str]) -> None:
+        self._matrix = matrix
+        self._ids = ids
+        self._id_rows = {doc_id: row for row, doc_id in enumerate(ids)}
+
+    def _documents_version(self) -> Optional[str]:
+        cursor = self._conn.cursor()
+        cursor.execute("SELECT value FROM store_meta WHERE key = 'documents_version'")
+        row = cursor.fetchone()
+        return row[0] if row else None
+
+    def _sidecar_paths(self) -> Tuple[Path, Path]:
+        return (
+            self.db_path.with_name(self.db_path.name + _MATRIX_SUFFIX),
+            self.db_path.with_name(self.db_path.name + _MATRIX_IDS_SUFFIX),
+        )
+
+    def _load_sidecar_matrix(self, version: Optional[str]) -> bool:
+        """Memory-map the sidecar matrix if it was saved at ``version``."""
+        matrix_path, ids_path = self._sidecar_paths()
+        try:
+            with open(ids_path, encoding="utf-8") as handle:
+                if handle.readline().rstrip("\n") != version:
+                    return False
+                ids = handle.read().splitlines()
+            matrix = np.load(matrix_path, mmap_mode="r")
+        except (OSError, ValueError):
+            return False
+
+        if matrix.ndim != 2 or len(matrix) != len(ids):
+            return False
+        self._set_matrix(matrix, ids)
+        return True
+
+    def _save_sidecar_matrix(self, version: Optional[str]) -> None:
+        """Persist the search matrix so the next process can map it directly."""
+        if version is None or not len(self._matrix):
+            return
+
+        matrix_path, ids_path = self._sidecar_paths()
+        try:
+            # Write the matrix before the ids file that marks it current
+            tmp_path = matrix_path.with_name(matrix_path.name + ".tmp")
+            with open(tmp_path, "wb") as handle:
+                np.save(handle, self._matrix)
+            os.replace(tmp_path, matrix_path)
+
+            tmp_path = ids_path.with_name(ids_path.name + ".tmp")
+            with open(tmp_path, "w", encoding="utf-8") as handle:
+                handle.write(version + "\n")
+                handle.write("\n".join(self._ids))
+            os.replace(tmp_path, ids_path)
+        except OSError as exc:
+            logger.debug("Could not save search matrix sidecar: %s", exc)
+
+    def _documents_changed(self, cursor: sqlite3.Cursor) -> None:
+        """Mark the documents table as changed; call before committing."""
+        cursor.execute(
+            "UPDATE store_meta SET value = ? WHERE key = 'documents_version'",
+            (os.urandom(8).hex(),),
+        )
+        self._invalidate_matrix()
+
+    def _invalidate_matrix(self) -> None:
+        """Drop the search matrix after the documents table changes."""
+        self._matrix = None
+        self._ids = []
+        self._id_rows = {}
+
+    def get_cached_embeddings(self, model: str, hashes: Sequence[str]) -> Dict[str, np.ndarray]:
+        """Look up cached embeddings for content hashes produced by ``model``."""
+        if not self._conn:
+            raise RuntimeError("Store not initialized")
+
+        cursor = self._conn.cursor()
+        unique = list(dict.fromkeys(hashes))
+        cached: Dict[str, np.ndarray] = {}
+
+        for start in range(0, len(unique), _SQL_BATCH_SIZE):
+            batch = unique[start : start + _SQL_BATCH_SIZE]
+            placeholders = ",".join("?" * len(batch))
+            cursor.execute(
+                f"SELECT hash, embedding FROM embedding_cache WHERE model = ? AND hash IN ({placeholders})",
+                [model, *batch],
             )
+            for digest, blob in cursor:
+                cached[digest] = _decode_embedding(blob)
 
-            results.append((doc, similarity))
+        return cached
 
-        # Sort by similarity and return top_k
-        results.sort(key=lambda x: x[1], reverse=True)
-        return results[:top_k]
+    def cache_embeddings(self, model: str, embeddings: Dict[str, np.ndarray]) -> None:
+        """Store embeddings produced by ``model`` keyed by content hash."""
+        if not self._conn:
+            raise RuntimeError("Store not initialized")
 
-    def _cosine_similarity(self, a: List[float], b: List[float]) -> float:
-        """Compute cosine similarity between two vectors."""
-        if len(a) != len(b):
-            return 0.0
+        cursor = self._conn.cursor()
+        cursor.executemany(
+            "INSERT OR REPLACE INTO embedding_cache (model, hash, embedding) VALUES (?, ?, ?)",
+            [
+                (model, digest, _encode_embedding(embedding)[0])
+                for digest, embedding in embeddings.items()
+            ],
+        )
+        self._conn.commit()
 
-        dot_product = sum(x * y for x, y in zip(a, b))
-        norm_a = math.sqrt(sum(x * x for x in a))
-        norm_b = math.sqrt(sum(x * x for x in b))
+    def get_source_states(self, paths: Sequence[str]) -> Dict[str, Tuple[int, int]]:
+        """Return the recorded ``(mtime_ns, size)`` for already indexed paths."""
+        if not self._conn:
+            raise RuntimeError("Store not initialized")
 
-        if norm_a == 0 or norm_b == 0:
-            return 0.0
+        cursor = self._conn.cursor()
+        states: Dict[str, Tuple[int, int]] = {}
 
-        return dot_product / (norm_a * norm_b)
+        for start in range(0, len(paths), _SQL_BATCH_SIZE):
+            batch = list(paths[start : start + _SQL_BATCH_SIZE])
+            placeholders = ",".join("?" * len(batch))
+            cursor.execute(
+                f"SELECT path, mtime_ns, size FROM sources WHERE path IN ({placeholders})",
+                batch,
+            )
+            for path, mtime_ns, size in cursor:
+                states[path] = (mtime_ns, size)
+
+        return states
 
-    def get_document(self, doc_id: str) -> Optional[Document]:
-        """Get a document by ID."""
+    def record_sources(self, states: Dict[str, Tuple[int, int]]) -> None:
+        """Record the ``(mtime_ns, size)`` each path was indexed at."""
         if not self._conn:
             raise RuntimeError("Store not initialized")
 
         cursor = self._conn.cursor()
-        cursor.execute(
-            "SELECT id, content, source, metadata, embedding FROM documents WHERE id = ?",
-            (doc_id,)
+        cursor.executemany(
+            "INSERT OR REPLACE INTO sources (path, mtime_ns, size) VALUES (?, ?, ?)",
+            [(path, mtime_ns, size) for path, (mtime_ns, size) in states.items()],
         )
+        self._conn.commit()
+
+    def get_document(self, doc_id: str, include_embedding: bool = False) -> Optional[Document]:
+        """Get a document by ID.
+
+        The embedding BLOB is only read when ``include_embedding`` is set.
+        """
+        if not self._conn:
+            raise RuntimeError("Store not initialized")
+
+        columns = "id, content, source, metadata"
+        if include_embedding:
+            columns += ", embedding, embedding_scale"
+
+        cursor = self._conn.cursor()
+        cursor.execute(f"SELECT {columns} FROM documents WHERE id = ?", (doc_id,))
 
         row = cursor.fetchone()
         if not row:
             return None
 
+        embedding = None
+        if include_embedding and row["embedding"]:
+            embedding = _decode_embedding(row["embedding"], row["embedding_scale"])
+
         return Document(
             id=row["id"],
             content=row["content"],
             source=row["source"],
             metadata=json.loads(row["metadata"]) if row["metadata"] else {},
-            embedding=json.loads(row["embedding"]) if row["embedding"] else None,
+            embedding=embedding,
         )
 
     def delete_by_source(self, source: str) -> int:
@@ -226,17 +574,63 @@ class VectorStore:
 
         cursor = self._conn.cursor()
         cursor.execute("DELETE FROM documents WHERE source = ?", (source,))
+        deleted = cursor.rowcount
+        cursor.execute("DELETE FROM sources WHERE path = ?", (source,))
+        self._documents_changed(cursor)
         self._conn.commit()
 
-        return cursor.rowcount
+        return deleted
+
+    def delete_by_sources(self, sources: Sequence[str]) -> int:
+        """Delete all documents from any of the given sources."""
+        if not self._conn:
+            raise RuntimeError("Store not initialized")
+
+        cursor = self._conn.cursor()
+        deleted = 0
+        for start in range(0, len(sources), _SQL_BATCH_SIZE):
+            batch = sources[start : start + _SQL_BATCH_SIZE]
+            placeholders = ",".join("?" * len(batch))
+            cursor.execute(f"DELETE FROM documents WHERE source IN ({placeholders})", list(batch))
+            deleted += cursor.rowcount
+            cursor.execute(f"DELETE FROM sources WHERE path IN ({placeholders})", list(batch))
+        self._documents_changed(cursor)
+        self._conn.commit()
+
+        return deleted
+
+    def prune_embedding_cache(self) -> int:
+        """Drop cached embeddings whose text no longer appears in any document.
+
+        Returns the number of cache entries removed.
+        """
+        if not self._conn:
+            raise RuntimeError("Store not initialized")
+
+        cursor = self._conn.cursor()
+        cursor.execute(
+            "DELETE FROM embedding_cache WHERE hash NOT IN "
+            "(SELECT content_hash FROM documents WHERE content_hash IS NOT NULL)"
+        )
+        pruned = cursor.rowcount
+        self._conn.commit()
+        if pruned:
+            logger.info("Pruned %d unused cached embeddings", pruned)
+        return pruned
 
     def clear(self) -> None:
-        """Clear all documents from the store."""
+        """Clear all documents from the store.
+
+        Cached embeddings are kept so an immediate reindex can reuse them;
+        call prune_embedding_cache() once indexing is done.
+        """
         if not self._conn:
             raise RuntimeError("Store not initialized")
 
         cursor = self._conn.cursor()
         cursor.execute("DELETE FROM documents")
+        cursor.execute("DELETE FROM sources")
+        self._documents_changed(cursor)
         self._conn.commit()
         logger.info("Cleared all documents from store")
 
@@ -254,6 +648,43 @@ class VectorStore:
         if self._conn:
             self._conn.close()
             self._conn = None
+        self._invalidate_matrix()
+
+
+def content_hash(text: str) -> str:
+    """Hash chunk text to key the embedding cache."""
+    return hashlib.blake2b(text.encode(), digest_size=16).hexdigest()
+
+
+def _encode_embedding(
+    embedding: Optional[np.ndarray],
+    quantize: bool = False,
+) -> Tuple[Optional[bytes], Optional[float]]:
+    """Serialize an embedding as ``(blob, scale)``.
+
+    Float32 embeddings are stored as raw bytes with no scale; quantized ones
+    as int8 codes plus the float scale that recovers them.
+    """
+    if embedding is None or len(embedding) == 0:
+        return None, None
+    if quantize:
+        codes, scales = quantize_int8(embedding)
+        return codes[0].tobytes(), float(scales[0])
+    return np.ascontiguousarray(embedding, dtype=_EMBED_DTYPE).tobytes(), None
+
+
+def _decode_embedding(blob: Union[bytes, str], scale: Optional[float] = None) -> np.ndarray:
+    """Deserialize an embedding blob into a float32 array.
+
+    Stores written before embeddings were kept as raw bytes hold JSON text,
+    which is still accepted.
+    """
+    if isinstance(blob, str):
+        return np.asarray(json.loads(blob), dtype=_EMBED_DTYPE)
+    if scale is not None:
+        codes = np.frombuffer(blob, dtype=np.int8)
+        return dequantize_int8(codes[np.newaxis, :], np.array([scale]))[0]
+    return np.frombuffer(blob, dtype=_EMBED_DTYPE)
 
 
-__all__ = ["VectorStore", "Document"]
+__all__ = ["VectorStore", "Document", "content_hash"]
@@ -4,10 +4,13 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import lru_cache
 from io import StringIO
 import shutil
+import threading
+import time
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, Sequence
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
 
 from rich.console import Console
 from rich.markdown import Markdown
@@ -17,13 +20,19 @@ from .configuration import ConfigurationBundle
 
 SlashCommandHandler = Callable[["SlashCommandContext", List[str]], str]
 
+# Seconds a queried terminal size is reused by render_rich.
+TERMINAL_SIZE_TTL = 1.0
+
+_terminal_size_cache: Tuple[float, Tuple[int, int]] = (float("-inf"), (80, 24))
+_render_state = threading.local()
+
 
 class CommandSource(str, Enum):
     USER = "user"
     PLANNER = "planner"
 
 
-@dataclass
+@dataclass(slots=True)
 class SlashCommandContext:
     """Context passed into each slash command handler."""
 
@@ -33,7 +42,7 @@ class SlashCommandContext:
     source: CommandSource = CommandSource.USER
 
 
-@dataclass
+@dataclass(slots=True)
 class SlashCommand:
     """Metadata about a slash command."""
 
@@ -54,10 +63,13 @@ class CommandRouter:
     ) -> None:
         self.config = config
         self._commands: Dict[str, SlashCommand] = {}
+        # Sorted command names, rebuilt on first use after register()
+        self._sorted_names: Optional[Tuple[str, ...]] = None
         self.metadata = metadata or {}
 
     def register(self, command: SlashCommand) -> None:
         self._commands[command.name.lower()] = command
+        self._sorted_names = None
 
     def handle(
         self,
@@ -89,10 +101,13 @@ class CommandRouter:
 
     @property
     def command_names(self) -> Sequence[str]:
-        return sorted(self._commands.keys())
+        if self._sorted_names is None:
+            self._sorted_names = tuple(sorted(self._commands))
+        return self._sorted_names
 
     def commands(self) -> Sequence[SlashCommand]:
-        return [self._commands[name] for name in self.command_names]
+        commands = self._commands
+        return [commands[name] for name in self.command_names]
 
     def get(self, command_name: str) -> Optional[SlashCommand]:
         return self._commands.get(command_name.lower())
@@ -135,28 +150,68 @@ class CommandRouter:
 
 
 def render_help_table(commands: Sequence[SlashCommand]) -> str:
-    """Render a help table listing slash commands."""
+    """Render a help table listing slash commands.
+
+    Output is cached per command list and terminal size, so repeated help
+    renders skip Rich layout entirely.
+    """
+    rows = tuple((cmd.name, cmd.description) for cmd in commands)
+    return _render_help_rows(rows, _terminal_size())
+
+
+@lru_cache(maxsize=16)
+def _render_help_rows(rows: Tuple[Tuple[str, str], ...], terminal_size: Tuple[int, int]) -> str:
+    # terminal_size only keys the cache; render_rich reads the same cached size
 
     def _render(console: Console) -> None:
         table = Table(title="Slash Commands", show_header=True, header_style="bold cyan")
         table.add_column("Command", style="green", no_wrap=True)
         table.add_column("Description")
-        for cmd in commands:
-            table.add_row(f"/{cmd.name}", cmd.description)
+        for name, description in rows:
+            table.add_row(f"/{name}", description)
         console.print(table)
 
     return render_rich(_render)
 
 
 def render_rich(render_fn: Callable[[Console], None]) -> str:
-    """Render a Rich layout to an ANSI string without printing live."""
-
-    terminal_size = shutil.get_terminal_size(fallback=(80, 24))
-    # Clamp to a reasonable minimum so Rich does not choke on ultra-small widths.
-    width = max(20, terminal_size.columns)
-    height = max(10, terminal_size.lines)
-
-    console = Console(
+    """Render a Rich layout to an ANSI string without printing live.
+
+    Each thread reuses one recording console; a nested call made from inside
+    ``render_fn`` gets a fresh one so it cannot clear the outer recording.
+    """
+
+    width, height = _terminal_size()
+    if getattr(_render_state, "busy", False):
+        return _render_with(_new_console(width, height), render_fn)
+
+    console: Optional[Console] = getattr(_render_state, "console", None)
+    if console is None:
+        console = _render_state.console = _new_console(width, height)
+    else:
+        console.size = (width, height)
+
+    _render_state.busy = True
+    try:
+        return _render_with(console, render_fn)
+    finally:
+        _render_state.busy = False
+
+
+def _render_with(console: Console, render_fn: Callable[[Console], None]) -> str:
+    # Always drain the recording so a failed render does not leak into the next
+    try:
+        render_fn(console)
+    finally:
+        text = console.export_text(clear=True, styles=True)
+        # Output is taken from the recording; empty the sink so it can be reused
+        console.file.seek(0)
+        console.file.truncate()
+    return text
+
+
+def _new_console(width: int, height: int) -> Console:
+    return Console(
         record=True,
         force_terminal=True,
         color_system="auto",
@@ -164,8 +219,20 @@ def render_rich(render_fn: Callable[[Console], None]) -> str:
         height=height,
         file=StringIO(),
     )
-    render_fn(console)
-    return console.export_text(clear=False, styles=True)
+
+
+def _terminal_size() -> Tuple[int, int]:
+    """Return the clamped terminal size, re-queried at most every TERMINAL_SIZE_TTL."""
+    global _terminal_size_cache
+
+    checked_at, size = _terminal_size_cache
+    now = time.monotonic()
+    if now - checked_at >= TERMINAL_SIZE_TTL:
+        terminal_size = shutil.get_terminal_size(fallback=(80, 24))
+        # Clamp to a reasonable minimum so Rich does not choke on ultra-small widths.
+        size = (max(20, terminal_size.columns), max(10, terminal_size.lines))
+        _terminal_size_cache = (now, size)
+    return size
 
 
 __all__ = [
@@ -2,20 +2,39 @@
 
 from __future__ import annotations
 
+import gzip
 import json
 import logging
+import secrets
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
+from http.client import HTTPConnection, HTTPSConnection, RemoteDisconnected
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 from urllib.error import HTTPError, URLError
+from urllib.parse import urlsplit
 from urllib.request import Request, urlopen
 
 from .conflict import ConflictResolver, ConflictResolution, ConflictStrategy
-from .manifest import FileInfo, ManifestBuilder, VaultManifest, compute_file_hash
+from .manifest import FileInfo, ManifestBuilder, VaultManifest, _dumps, _loads, compute_file_hash
 from .protocol import FileChange, SyncAction, SyncDelta, SyncRequest, SyncResponse, compute_delta
 
 logger = logging.getLogger("ember.sync.client")
 
+# Bytes read from disk per write while streaming an upload body
+UPLOAD_CHUNK_SIZE = 64 * 1024
+
+# Fast gzip level for sync request bodies; manifest JSON compresses well
+# even at the cheapest setting
+SYNC_GZIP_LEVEL = 1
+
+# Concurrent uploads, each worker keeping one keep-alive connection
+MAX_UPLOAD_WORKERS = 8
+
+# Errors from a kept-alive connection the server has since closed
+_STALE_CONNECTION_ERRORS = (RemoteDisconnected, ConnectionResetError, BrokenPipeError)
+
 
 @dataclass
 class SyncSettings:
@@ -95,9 +114,12 @@ class SyncClient:
 
         self._manifest_path = vault_dir / settings.manifest_path
 
-    def build_manifest(self) -> VaultManifest:
-        """Build a fresh manifest of local vault contents."""
-        return self.builder.build()
+    def build_manifest(self, prior: Optional[VaultManifest] = None) -> VaultManifest:
+        """Build a fresh manifest of local vault contents.
+
+        Unchanged files listed in ``prior`` keep their recorded hash.
+        """
+        return self.builder.build(prior)
 
     def load_manifest(self) -> Optional[VaultManifest]:
         """Load the last saved manifest."""
@@ -114,7 +136,7 @@ class SyncClient:
             logger.info("No previous manifest found - all files are new")
             return None
 
-        current_manifest = self.build_manifest()
+        current_manifest = self.build_manifest(old_manifest)
         return compute_delta(current_manifest, old_manifest)
 
     def sync_with_server(self, server_url: Optional[str] = None) -> SyncResult:
@@ -129,8 +151,8 @@ class SyncClient:
         result = SyncResult(success=True)
 
         try:
-            # Build local manifest
-            local_manifest = self.build_manifest()
+            # Build local manifest, reusing hashes of files unchanged since the last sync
+            local_manifest = self.build_manifest(self.load_manifest())
             self._report_progress("Building manifest", 1, 5)
 
             # Send sync request to server
@@ -202,51 +224,108 @@ class SyncClient:
     def _send_request(self, url: str, request: SyncRequest) -> SyncResponse:
         """Send a sync request to the server."""
         endpoint = f"{url.rstrip('/')}/api/v1/sync"
-        data = json.dumps(request.to_dict()).encode("utf-8")
+        data = gzip.compress(_dumps(request.to_dict(encode_files=False)), compresslevel=SYNC_GZIP_LEVEL)
 
         req = Request(
             endpoint,
             data=data,
-            headers={"Content-Type": "application/json"},
+            headers={
+                "Content-Type": "application/json",
+                "Content-Encoding": "gzip",
+                "Accept-Encoding": "gzip",
+            },
             method="POST",
         )
 
         with urlopen(req, timeout=30) as resp:
-            response_data = json.loads(resp.read().decode("utf-8"))
-            return SyncResponse.from_dict(response_data)
+            body = resp.read()
+            if resp.headers.get("Content-Encoding", "").lower() == "gzip":
+                body = gzip.decompress(body)
+            return SyncResponse.from_dict(_loads(body))
 
     def _upload_files(self, url: str, changes: List[FileChange]) -> int:
-        """Upload files to the server."""
-        uploaded = 0
-        endpoint = f"{url.rstrip('/')}/api/v1/sync/upload"
-
-        for change in changes:
+        """Upload files to the server.
+
+        Uploads run on up to MAX_UPLOAD_WORKERS threads, each reusing one
+        keep-alive connection for all of its files.
+        """
+        if not changes:
+            return 0
+
+        endpoint = urlsplit(f"{url.rstrip('/')}/api/v1/sync/upload")
+        connection_cls = HTTPSConnection if endpoint.scheme == "https" else HTTPConnection
+        local = threading.local()
+        opened: List[HTTPConnection] = []
+        opened_lock = threading.Lock()
+
+        def connection() -> HTTPConnection:
+            conn = getattr(local, "connection", None)
+            if conn is None:
+                conn = local.connection = connection_cls(endpoint.hostname, endpoint.port, timeout=60)
+                with opened_lock:
+                    opened.append(conn)
+            return conn
+
+        def upload(change: FileChange) -> bool:
             try:
                 file_path = self.vault_dir / change.path
                 if not file_path.exists():
                     logger.warning("File not found for upload: %s", change.path)
-                    continue
-
-                content = file_path.read_bytes()
-                change.content = content
-
-                data = json.dumps(change.to_dict()).encode("utf-8")
-                req = Request(
-                    endpoint,
-                    data=data,
-                    headers={"Content-Type": "application/json"},
-                    method="POST",
-                )
+                    return False
 
-                with urlopen(req, timeout=60) as resp:
-                    if resp.status == 200:
-                        uploaded += 1
-                        logger.debug("Uploaded: %s", change.path)
+                status, reason = self._post_upload(connection(), endpoint.path, change, file_path)
+                if status >= 400:
+                    raise HTTPError(endpoint.geturl(), status, reason, None, None)
+                if status == 200:
+                    logger.debug("Uploaded: %s", change.path)
+                    return True
+                return False
 
             except Exception as e:
                 logger.error("Failed to upload %s: %s", change.path, e)
+                return False
 
-        return uploaded
+        workers = min(MAX_UPLOAD_WORKERS, len(changes))
+        try:
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="sync-upload") as executor:
+                return sum(executor.map(upload, changes))
+        finally:
+            for conn in opened:
+                conn.close()
+
+    def _post_upload(
+        self,
+        connection: HTTPConnection,
+        path: str,
+        change: FileChange,
+        file_path: Path,
+    ) -> Tuple[int, str]:
+        """POST one file over ``connection`` and read the full response.
+
+        If the server closed the kept-alive connection since its last use, the
+        upload is retried once on a fresh connection.
+        """
+        while True:
+            reused = connection.sock is not None
+            content_type, length, body = _multipart_upload(change, file_path)
+            headers = {"Content-Type": content_type, "Content-Length": str(length)}
+            try:
+                connection.request("POST", path, body=body, headers=headers)
+                response = connection.getresponse()
+                response.read()
+            except _STALE_CONNECTION_ERRORS:
+                # close() drops the socket, so the retry connects afresh
+                connection.close()
+                if reused:
+                    continue
+                raise
+            except Exception:
+                connection.close()
+                raise
+
+            if response.will_close:
+                connection.close()
+            return response.status, response.reason
 
     def _download_files(self, files: List[FileChange]) -> int:
         """Download and save files from the response."""
@@ -313,4 +392,41 @@ class SyncClient:
         }
 
 
+def _multipart_upload(change: FileChange, file_path: Path) -> Tuple[str, int, Iterator[bytes]]:
+    """Build a streamed multipart/form-data body for uploading ``file_path``.
+
+    The body has a ``meta`` part with the change as JSON (without content) and
+    a ``content`` part with the raw file bytes, read in UPLOAD_CHUNK_SIZE
+    pieces. Returns ``(content_type, content_length, body)``.
+    """
+    boundary = secrets.token_hex(16)
+    meta = _dumps(change.to_dict(exclude_content=True))
+    filename = json.dumps(Path(change.path).name)  # quoted and escaped
+    head = (
+        f"--{boundary}\r\n"
+        'Content-Disposition: form-data; name="meta"\r\n'
+        "Content-Type: application/json\r\n\r\n"
+    ).encode("utf-8") + meta + (
+        f"\r\n--{boundary}\r\n"
+        f'Content-Disposition: form-data; name="content"; filename={filename}\r\n'
+        "Content-Type: application/octet-stream\r\n\r\n"
+    ).encode("utf-8")
+    tail = f"\r\n--{boundary}--\r\n".encode("utf-8")
+    size = file_path.stat().st_size
+
+    def body() -> Iterator[bytes]:
+        yield head
+        with open(file_path, "rb") as f:
+            remaining = size
+            while remaining > 0:
+                chunk = f.read(min(UPLOAD_CHUNK_SIZE, remaining))
+                if not chunk:
+                    raise OSError(f"{file_path} shrank during upload")
+                remaining -= len(chunk)
+                yield chunk
+        yield tail
+
+    return f"multipart/form-data; boundary={boundary}", len(head) + size + len(tail), body()
+
+
 __all__ = ["SyncClient", "SyncSettings", "SyncResult"]
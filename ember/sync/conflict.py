@@ -8,12 +8,20 @@ from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from typing import Callable, Optional
+from typing import Callable, Dict, Optional
 
 from .protocol import FileChange, SyncAction
 
+try:
+    import fcntl
+except ImportError:  # not available on Windows
+    fcntl = None  # type: ignore[assignment]
+
 logger = logging.getLogger("ember.sync.conflict")
 
+# Linux ioctl that makes dst share src's extents copy-on-write (btrfs, XFS)
+_FICLONE = 0x40049409
+
 
 class ConflictStrategy(str, Enum):
     """Strategies for resolving sync conflicts."""
@@ -46,6 +54,13 @@ class ConflictResolver:
         self.vault_dir = vault_dir
         self.strategy = strategy
         self.backup_dir = backup_dir or vault_dir / ".sync_backups"
+        self._handlers: Dict[ConflictStrategy, Callable[[FileChange], ConflictResolution]] = {
+            ConflictStrategy.NEWEST_WINS: self._resolve_newest_wins,
+            ConflictStrategy.LOCAL_WINS: self._resolve_local_wins,
+            ConflictStrategy.REMOTE_WINS: self._resolve_remote_wins,
+            ConflictStrategy.BACKUP_BOTH: self._resolve_backup_both,
+            ConflictStrategy.MANUAL: self._resolve_manual,
+        }
 
     def resolve(self, change: FileChange) -> ConflictResolution:
         """Resolve a single conflict based on the configured strategy."""
@@ -56,16 +71,7 @@ class ConflictResolver:
                 message="Not a conflict",
             )
 
-        if self.strategy == ConflictStrategy.NEWEST_WINS:
-            return self._resolve_newest_wins(change)
-        elif self.strategy == ConflictStrategy.LOCAL_WINS:
-            return self._resolve_local_wins(change)
-        elif self.strategy == ConflictStrategy.REMOTE_WINS:
-            return self._resolve_remote_wins(change)
-        elif self.strategy == ConflictStrategy.BACKUP_BOTH:
-            return self._resolve_backup_both(change)
-        else:  # MANUAL
-            return self._resolve_manual(change)
+        return self._handlers.get(self.strategy, self._resolve_manual)(change)
 
     def _resolve_newest_wins(self, change: FileChange) -> ConflictResolution:
         """Use whichever version has the newer modification time."""
@@ -132,7 +138,10 @@ class ConflictResolver:
         backup_name = f"{Path(rel_path).stem}_{timestamp}{Path(rel_path).suffix}"
         backup_path = self.backup_dir / backup_name
 
-        shutil.copy2(source, backup_path)
+        if _clone_file(source, backup_path):
+            shutil.copystat(source, backup_path)
+        else:
+            shutil.copy2(source, backup_path)
         logger.info("Created backup: %s -> %s", source, backup_path)
         return backup_path
 
@@ -141,4 +150,27 @@ class ConflictResolver:
         return [self.resolve(c) for c in conflicts]
 
 
+def _clone_file(source: Path, destination: Path) -> bool:
+    """Reflink ``source`` to ``destination`` if the filesystem supports it.
+
+    A reflink shares data blocks copy-on-write, so it is instant and safe to
+    overwrite afterwards. A hardlink would not be: the local file is later
+    rewritten in place and the backup would change with it. Returns False,
+    leaving no destination behind, when cloning is not possible.
+    """
+    if fcntl is None:
+        return False
+    try:
+        with open(source, "rb") as src, open(destination, "wb") as dst:
+            try:
+                fcntl.ioctl(dst.fileno(), _FICLONE, src.fileno())
+                return True
+            except OSError:
+                pass
+    except OSError:
+        return False
+    destination.unlink(missing_ok=True)
+    return False
+
+
 __all__ = ["ConflictStrategy", "ConflictResolution", "ConflictResolver"]
@@ -6,15 +6,26 @@ import fnmatch
 import hashlib
 import json
 import logging
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, Iterator, List, Optional, Sequence
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json is the fallback
+    orjson = None  # type: ignore[assignment]
 
 logger = logging.getLogger("ember.sync.manifest")
 
+# Threads hashing files in parallel while building a manifest
+MAX_HASH_WORKERS = min(32, (os.cpu_count() or 4) * 2)
+
 
-@dataclass
+@dataclass(slots=True)
 class FileInfo:
     """Information about a single file in the vault."""
 
@@ -44,7 +55,7 @@ class FileInfo:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class VaultManifest:
     """Complete manifest of vault contents for synchronization."""
 
@@ -54,13 +65,22 @@ class VaultManifest:
     created_at: str = field(default_factory=lambda: datetime.now(timezone.utc).isoformat())
     files: Dict[str, FileInfo] = field(default_factory=dict)
 
-    def to_dict(self) -> Dict[str, Any]:
+    def to_dict(self, encode_files: bool = True) -> Dict[str, Any]:
+        """Convert to a JSON-ready dict.
+
+        With ``encode_files=False`` the ``files`` mapping holds the FileInfo
+        objects themselves, which ``_dumps`` encodes without building a dict
+        per file.
+        """
         return {
             "node_id": self.node_id,
             "vault_dir": str(self.vault_dir),
             "version": self.version,
             "created_at": self.created_at,
-            "files": {path: info.to_dict() for path, info in self.files.items()},
+            "files": (
+                {path: info.to_dict() for path, info in self.files.items()}
+                if encode_files else self.files
+            ),
         }
 
     @classmethod
@@ -78,8 +98,7 @@ class VaultManifest:
     def save(self, path: Path) -> None:
         """Save manifest to a JSON file."""
         path.parent.mkdir(parents=True, exist_ok=True)
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(self.to_dict(), f, indent=2)
+        path.write_bytes(_dumps(self.to_dict(encode_files=False), indent=True))
         logger.debug("Saved manifest to %s (%d files)", path, len(self.files))
 
     @classmethod
@@ -88,9 +107,7 @@ class VaultManifest:
         if not path.exists():
             return None
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-            return cls.from_dict(data)
+            return cls.from_dict(_loads(path.read_bytes()))
         except (json.JSONDecodeError, KeyError) as e:
             logger.error("Failed to load manifest from %s: %s", path, e)
             return None
@@ -110,78 +127,201 @@ class ManifestBuilder:
         self.node_id = node_id
         self.sync_dirs = list(sync_dirs) if sync_dirs else ["config", "library", "notes"]
         self.exclude_patterns = list(exclude_patterns) if exclude_patterns else []
+        self._exclude_re = _compile_patterns(self.exclude_patterns)
+        # "dir/*" excludes everything below any directory matching "dir", so
+        # those directories are not walked at all
+        self._dir_exclude_re = _compile_patterns(_directory_patterns(self.exclude_patterns))
+
+    def build(self, prior: Optional[VaultManifest] = None) -> VaultManifest:
+        """Build a manifest by scanning the vault.
 
-    def build(self) -> VaultManifest:
-        """Build a manifest by scanning the vault."""
+        Files whose size and mtime match their entry in ``prior`` reuse its
+        hash instead of being read again.
+        """
         manifest = VaultManifest(
             node_id=self.node_id,
             vault_dir=self.vault_dir,
         )
 
-        for file_path in self._iter_files():
-            try:
-                info = self._get_file_info(file_path)
-                manifest.files[info.path] = info
-            except OSError as e:
-                logger.warning("Failed to read file %s: %s", file_path, e)
+        known: Dict[str, FileInfo] = {}
+        trusted_before = 0.0
+        if prior is not None:
+            known = prior.files
+            trusted_before = _parse_created_at(prior.created_at)
+
+        def file_info(item: Tuple[str, os.DirEntry]) -> Optional[FileInfo]:
+            return self._try_get_file_info(item[0], item[1], known, trusted_before)
+
+        files = list(self._iter_files())
+        if files:
+            # hashlib releases the GIL while hashing, so threads scale with cores
+            workers = min(MAX_HASH_WORKERS, len(files))
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="manifest-hash") as executor:
+                for info in executor.map(file_info, files):
+                    if info is not None:
+                        manifest.files[info.path] = info
 
         logger.info("Built manifest with %d files", len(manifest.files))
         return manifest
 
-    def _iter_files(self) -> Iterator[Path]:
-        """Iterate over all syncable files in the vault."""
+    def _iter_files(self) -> Iterator[Tuple[str, os.DirEntry]]:
+        """Iterate over all syncable files in the vault.
+
+        Yields ``(rel_path, entry)`` pairs, walking with ``os.scandir`` so file
+        and directory checks come from the listing itself. Symlinked
+        directories are not descended into; unreadable ones are skipped.
+        """
+        prefix_length = len(os.path.join(os.fspath(self.vault_dir), ""))
+
         for sync_dir in self.sync_dirs:
-            dir_path = self.vault_dir / sync_dir
-            if not dir_path.exists():
+            root = os.fspath(self.vault_dir / sync_dir)
+            if self._is_dir_excluded(root[prefix_length:]):
                 continue
 
-            for file_path in dir_path.rglob("*"):
-                if not file_path.is_file():
+            pending = [root]
+            while pending:
+                try:
+                    with os.scandir(pending.pop()) as entries:
+                        for entry in entries:
+                            try:
+                                if entry.is_file():
+                                    rel_path = entry.path[prefix_length:]
+                                    if not self._is_excluded(rel_path):
+                                        yield rel_path, entry
+                                elif entry.is_dir(follow_symlinks=False):
+                                    if not self._is_dir_excluded(entry.path[prefix_length:]):
+                                        pending.append(entry.path)
+                            except OSError:
+                                continue
+                except (FileNotFoundError, NotADirectoryError):
                     continue
-
-                rel_path = str(file_path.relative_to(self.vault_dir))
-                if self._is_excluded(rel_path):
-                    continue
-
-                yield file_path
+                except OSError as e:
+                    logger.warning("Failed to list directory: %s", e)
 
     def _is_excluded(self, rel_path: str) -> bool:
         """Check if a path matches any exclude pattern."""
-        for pattern in self.exclude_patterns:
-            if fnmatch.fnmatch(rel_path, pattern):
-                return True
-            # Also check just the filename
-            if fnmatch.fnmatch(Path(rel_path).name, pattern):
-                return True
-        return False
-
-    def _get_file_info(self, file_path: Path) -> FileInfo:
-        """Get file info including hash."""
-        stat = file_path.stat()
-        rel_path = str(file_path.relative_to(self.vault_dir))
-
-        # Calculate SHA-256 hash
-        hasher = hashlib.sha256()
-        with open(file_path, "rb") as f:
-            for chunk in iter(lambda: f.read(8192), b""):
-                hasher.update(chunk)
+        if self._exclude_re is None:
+            return False
+        rel_path = os.path.normcase(rel_path)
+        # Also check just the filename
+        return bool(
+            self._exclude_re.match(rel_path)
+            or self._exclude_re.match(os.path.basename(rel_path))
+        )
+
+    def _is_dir_excluded(self, rel_dir: str) -> bool:
+        """Check if every file below a directory is excluded by a "dir/*" pattern."""
+        if self._dir_exclude_re is None:
+            return False
+        return bool(self._dir_exclude_re.match(os.path.normcase(rel_dir)))
+
+    def _try_get_file_info(
+        self,
+        rel_path: str,
+        entry: os.DirEntry,
+        known: Optional[Dict[str, FileInfo]] = None,
+        trusted_before: float = 0.0,
+    ) -> Optional[FileInfo]:
+        """Run _get_file_info, logging and returning None if the file is unreadable."""
+        try:
+            return self._get_file_info(rel_path, entry, known, trusted_before)
+        except OSError as e:
+            logger.warning("Failed to read file %s: %s", entry.path, e)
+            return None
+
+    def _get_file_info(
+        self,
+        rel_path: str,
+        entry: os.DirEntry,
+        known: Optional[Dict[str, FileInfo]] = None,
+        trusted_before: float = 0.0,
+    ) -> FileInfo:
+        """Get file info including hash.
+
+        The hash in ``known`` is reused when size and mtime are unchanged and
+        the file was last modified before ``trusted_before``; a write in the
+        same instant the prior manifest was built would not move its mtime.
+        """
+        stat = entry.stat()
+
+        previous = known.get(rel_path) if known else None
+        if (
+            previous is not None
+            and previous.size == stat.st_size
+            and previous.mtime == stat.st_mtime
+            and stat.st_mtime < trusted_before
+        ):
+            file_hash = previous.hash
+        else:
+            file_hash = compute_file_hash(Path(entry.path))
 
         return FileInfo(
             path=rel_path,
-            hash=hasher.hexdigest(),
+            hash=file_hash,
             size=stat.st_size,
             mtime=stat.st_mtime,
             mode=stat.st_mode & 0o777,
         )
 
 
+def _dumps(data: Any, indent: bool = False) -> bytes:
+    """Serialize to UTF-8 JSON bytes, preferring orjson when installed.
+
+    FileInfo values are encoded as their to_dict() form; orjson serializes
+    the dataclass fields natively.
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(data, indent=2 if indent else None, default=_encode_default).encode("utf-8")
+
+
+def _encode_default(obj: Any) -> Any:
+    if isinstance(obj, FileInfo):
+        return obj.to_dict()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _loads(data: Union[str, bytes]) -> Any:
+    """Parse JSON text or UTF-8 bytes, preferring orjson when installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _parse_created_at(created_at: str) -> float:
+    """Convert a manifest's created_at to a Unix timestamp (0.0 if unparseable)."""
+    try:
+        return datetime.fromisoformat(created_at).timestamp()
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def _directory_patterns(patterns: Sequence[str]) -> List[str]:
+    """Return "dir" for each "dir/*" or "dir/**" pattern."""
+    directories = []
+    for pattern in patterns:
+        if pattern.endswith(("/*", "/**")):
+            directory = pattern.rstrip("*")[:-1]
+            if directory and not directory.endswith("/"):
+                directories.append(directory)
+    return directories
+
+
+def _compile_patterns(patterns: Sequence[str]) -> Optional[re.Pattern[str]]:
+    """Combine fnmatch-style patterns into one regex, matched like fnmatch.fnmatch."""
+    if not patterns:
+        return None
+    return re.compile(
+        "|".join(f"(?:{fnmatch.translate(os.path.normcase(p))})" for p in patterns)
+    )
+
+
 def compute_file_hash(file_path: Path) -> str:
     """Compute SHA-256 hash of a file."""
-    hasher = hashlib.sha256()
+    # file_digest reads into large buffers and hashes them without
+    # returning to Python per chunk
     with open(file_path, "rb") as f:
-        for chunk in iter(lambda: f.read(8192), b""):
-            hasher.update(chunk)
-    return hasher.hexdigest()
+        return hashlib.file_digest(f, "sha256").hexdigest()
 
 
 __all__ = ["VaultManifest", "FileInfo", "ManifestBuilder", "compute_file_hash"]
@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import base64
+import binascii
+import sys
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
@@ -21,7 +23,11 @@ class SyncAction(str, Enum):
     SKIP = "skip"
 
 
-@dataclass
+# Wire value to member, avoiding Enum.__call__ per parsed change
+_ACTIONS_BY_VALUE: Dict[str, SyncAction] = {action.value: action for action in SyncAction}
+
+
+@dataclass(slots=True)
 class FileChange:
     """Represents a change to a single file."""
 
@@ -31,7 +37,8 @@ class FileChange:
     remote_info: Optional[FileInfo] = None
     content: Optional[bytes] = None  # For ADD/UPDATE actions
 
-    def to_dict(self) -> Dict[str, Any]:
+    def to_dict(self, exclude_content: bool = False) -> Dict[str, Any]:
+        """Convert to a dict, with content as base64 text under ``content``."""
         result = {
             "path": self.path,
             "action": self.action.value,
@@ -40,8 +47,8 @@ class FileChange:
             result["local_info"] = self.local_info.to_dict()
         if self.remote_info:
             result["remote_info"] = self.remote_info.to_dict()
-        if self.content:
-            result["content"] = base64.b64encode(self.content).decode("ascii")
+        if self.content and not exclude_content:
+            result["content"] = binascii.b2a_base64(self.content, newline=False).decode("ascii")
         return result
 
     @classmethod
@@ -51,15 +58,16 @@ class FileChange:
             content = base64.b64decode(data["content"])
 
         return cls(
-            path=data["path"],
-            action=SyncAction(data["action"]),
+            # The same path shows up in both the delta and the files list
+            path=sys.intern(data["path"]),
+            action=_ACTIONS_BY_VALUE.get(data["action"]) or SyncAction(data["action"]),
             local_info=FileInfo.from_dict(data["local_info"]) if data.get("local_info") else None,
             remote_info=FileInfo.from_dict(data["remote_info"]) if data.get("remote_info") else None,
             content=content,
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class SyncDelta:
     """Computed differences between two manifests."""
 
@@ -111,7 +119,7 @@ class SyncDelta:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class SyncRequest:
     """Request sent to initiate or continue a sync operation."""
 
@@ -120,10 +128,10 @@ class SyncRequest:
     request_type: str = "full"  # "full", "delta", "pull", "push"
     timestamp: str = field(default_factory=lambda: datetime.now(timezone.utc).isoformat())
 
-    def to_dict(self) -> Dict[str, Any]:
+    def to_dict(self, encode_files: bool = True) -> Dict[str, Any]:
         return {
             "node_id": self.node_id,
-            "manifest": self.manifest.to_dict(),
+            "manifest": self.manifest.to_dict(encode_files),
             "request_type": self.request_type,
             "timestamp": self.timestamp,
         }
@@ -138,7 +146,7 @@ class SyncRequest:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class SyncResponse:
     """Response from a sync operation."""
 
@@ -167,19 +175,16 @@ class SyncResponse:
         delta = None
         if "delta" in data:
             delta_data = data["delta"]
+            from_dict = FileChange.from_dict
             delta = SyncDelta(
                 local_node=delta_data["local_node"],
                 remote_node=delta_data["remote_node"],
+                to_upload=[from_dict(c) for c in delta_data.get("to_upload", ())],
+                to_download=[from_dict(c) for c in delta_data.get("to_download", ())],
+                conflicts=[from_dict(c) for c in delta_data.get("conflicts", ())],
             )
-            # Parse changes
-            for change_data in delta_data.get("to_upload", []):
-                delta.to_upload.append(FileChange.from_dict(change_data))
-            for change_data in delta_data.get("to_download", []):
-                delta.to_download.append(FileChange.from_dict(change_data))
-            for change_data in delta_data.get("conflicts", []):
-                delta.conflicts.append(FileChange.from_dict(change_data))
 
-        files = [FileChange.from_dict(f) for f in data.get("files", [])]
+        files = [FileChange.from_dict(f) for f in data.get("files", ())]
 
         return cls(
             status=data["status"],
@@ -201,29 +206,36 @@ def compute_delta(
         remote_node=remote_manifest.node_id,
     )
 
-    local_paths = set(local_manifest.files.keys())
-    remote_paths = set(remote_manifest.files.keys())
-
-    # Files only in local (to upload)
-    for path in local_paths - remote_paths:
-        delta.to_upload.append(FileChange(
-            path=path,
-            action=SyncAction.ADD,
-            local_info=local_manifest.files[path],
-        ))
-
-    # Files only in remote (to download)
-    for path in remote_paths - local_paths:
-        delta.to_download.append(FileChange(
-            path=path,
-            action=SyncAction.ADD,
-            remote_info=remote_manifest.files[path],
-        ))
-
-    # Files in both (check for changes)
-    for path in local_paths & remote_paths:
-        local_info = local_manifest.files[path]
-        remote_info = remote_manifest.files[path]
+    local_files = local_manifest.files
+    remote_files = remote_manifest.files
+
+    # With one side empty every file on the other side is simply new
+    if not local_files or not remote_files:
+        delta.to_upload = [
+            FileChange(path=path, action=SyncAction.ADD, local_info=info)
+            for path, info in local_files.items()
+        ]
+        delta.to_download = [
+            FileChange(path=path, action=SyncAction.ADD, remote_info=info)
+            for path, info in remote_files.items()
+        ]
+        return delta
+
+    # One pass over local files classifies each with a single remote lookup;
+    # the appends and enum members are bound once outside the loop
+    upload = delta.to_upload.append
+    download = delta.to_download.append
+    conflict = delta.conflicts.append
+    get_remote = remote_files.get
+    add, update = SyncAction.ADD, SyncAction.UPDATE
+
+    for path, local_info in local_files.items():
+        remote_info = get_remote(path)
+
+        if remote_info is None:
+            # Only in local - upload
+            upload(FileChange(path=path, action=add, local_info=local_info))
+            continue
 
         if local_info.hash == remote_info.hash:
             # Same content, no change needed
@@ -232,28 +244,27 @@ def compute_delta(
         # Content differs - determine direction based on mtime
         if local_info.mtime > remote_info.mtime:
             # Local is newer - upload
-            delta.to_upload.append(FileChange(
-                path=path,
-                action=SyncAction.UPDATE,
-                local_info=local_info,
-                remote_info=remote_info,
-            ))
+            append, action = upload, update
         elif remote_info.mtime > local_info.mtime:
             # Remote is newer - download
-            delta.to_download.append(FileChange(
-                path=path,
-                action=SyncAction.UPDATE,
-                local_info=local_info,
-                remote_info=remote_info,
-            ))
+            append, action = download, update
         else:
             # Same mtime but different hash - conflict
-            delta.conflicts.append(FileChange(
-                path=path,
-                action=SyncAction.CONFLICT,
-                local_info=local_info,
-                remote_info=remote_info,
-            ))
+            append, action = conflict, SyncAction.CONFLICT
+
+        append(FileChange(
+            path=path,
+            action=action,
+            local_info=local_info,
+            remote_info=remote_info,
+        ))
+
+    # Files only in remote (to download), added with a single extend
+    delta.to_download.extend([
+        FileChange(path=path, action=SyncAction.ADD, remote_info=remote_info)
+        for path, remote_info in remote_files.items()
+        if path not in local_files
+    ])
 
     return delta
 
@@ -39,6 +39,7 @@ def test_load_runtime_configuration_merges_repo_and_vault(tmp_path: Path, monkey
     assert bundle.status == "ready"
     assert bundle.merged["runtime"]["mode"] == "prod"
     assert bundle.merged["runtime"]["debug"] is False
+    assert bundle.repo_defaults == {"runtime": {"mode": "dev"}}
     assert len(bundle.files_loaded) == 2
 
 
@@ -66,3 +67,43 @@ def test_load_runtime_configuration_handles_bad_yaml(tmp_path: Path, monkeypatch
 
     assert bundle.status == "invalid"
     assert any("Failed to parse" in diag.message for diag in bundle.diagnostics)
+
+
+def test_load_runtime_configuration_reparses_changed_yaml(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    repo_dir = _prepare_repo_defaults(tmp_path, content="runtime:\n  name: First\n")
+    monkeypatch.setattr(configuration, "DEFAULT_CONFIG_DIR", repo_dir)
+    vault_dir = tmp_path / "vault"
+    vault_dir.mkdir()
+
+    first = configuration.load_runtime_configuration(vault_dir)
+    assert first.merged["runtime"]["name"] == "First"
+
+    calls = []
+    original_load = configuration.yaml.load
+
+    def counting_load(stream, Loader):
+        calls.append(stream)
+        return original_load(stream, Loader=Loader)
+
+    monkeypatch.setattr(configuration.yaml, "load", counting_load)
+
+    again = configuration.load_runtime_configuration(vault_dir)
+    assert again.merged["runtime"]["name"] == "First"
+    assert calls == []
+
+    (repo_dir / "10-default.yml").write_text("runtime:\n  name: Second one\n", encoding="utf-8")
+    updated = configuration.load_runtime_configuration(vault_dir)
+    assert updated.merged["runtime"]["name"] == "Second one"
+    assert len(calls) == 1
+
+
+def test_load_runtime_configuration_applies_yml_before_yaml(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    repo_dir = _prepare_repo_defaults(tmp_path, content="runtime:\n  name: yml\n")
+    (repo_dir / "00-first.yaml").write_text("runtime:\n  name: yaml\n", encoding="utf-8")
+    (repo_dir / "notes.txt").write_text("runtime: ignored\n", encoding="utf-8")
+    monkeypatch.setattr(configuration, "DEFAULT_CONFIG_DIR", repo_dir)
+
+    bundle = configuration.load_runtime_configuration(tmp_path / "missing")
+
+    assert bundle.merged["runtime"]["name"] == "yaml"
+    assert [path.name for path in bundle.files_loaded] == ["10-default.yml", "00-first.yaml"]
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import json
 import logging
 from logging.handlers import RotatingFileHandler
 from pathlib import Path
@@ -10,6 +11,7 @@ from ember import logging_utils
 
 
 def _reset_logger() -> logging.Logger:
+    logging_utils.stop_logging()
     logger = logging.getLogger("ember")
     for handler in list(logger.handlers):
         logger.removeHandler(handler)
@@ -26,11 +28,33 @@ def test_setup_logging_creates_rotating_file(tmp_path: Path):
     assert log_path == tmp_path / "logs" / "agents" / "core.log"
     assert log_path.exists()
 
+    assert [type(handler) for handler in logger.handlers] == [logging_utils._LocalQueueHandler]
     file_handlers = [
-        handler for handler in logger.handlers if isinstance(handler, RotatingFileHandler)
+        handler
+        for handler in logging_utils._LISTENER.handlers
+        if isinstance(handler, RotatingFileHandler)
     ]
-    assert len(file_handlers) == 1
-    assert file_handlers[0].baseFilename == str(log_path)
+    assert [handler.baseFilename for handler in file_handlers] == [
+        str(log_path),
+        str(tmp_path / "logs" / "agents" / "core.jsonl"),
+    ]
+
+
+def test_setup_logging_writes_through_listener(tmp_path: Path):
+    logger = _reset_logger()
+    log_path = logging_utils.setup_logging(tmp_path, level="INFO")
+
+    try:
+        raise ValueError("boom")
+    except ValueError:
+        logger.exception("failed %s", "task")
+    logging_utils.stop_logging()
+
+    assert "failed task" in log_path.read_text(encoding="utf-8")
+    structured = (tmp_path / "logs" / "agents" / "core.jsonl").read_text(encoding="utf-8")
+    entry = json.loads(structured.splitlines()[-1])
+    assert entry["message"] == "failed task"
+    assert "ValueError: boom" in entry["exception"]
 
 
 def test_setup_logging_is_idempotent(tmp_path: Path):
@@ -38,8 +62,11 @@ def test_setup_logging_is_idempotent(tmp_path: Path):
     logging_utils.setup_logging(tmp_path, level="INFO")
     handler_count = len(logger.handlers)
 
+    listener_handler_count = len(logging_utils._LISTENER.handlers)
+
     logging_utils.setup_logging(tmp_path, level="INFO")
     assert len(logger.handlers) == handler_count
+    assert len(logging_utils._LISTENER.handlers) == listener_handler_count
 
 
 def test_setup_logging_falls_back_when_permission_denied(tmp_path: Path, monkeypatch):
@@ -62,3 +89,46 @@ def test_setup_logging_falls_back_when_permission_denied(tmp_path: Path, monkeyp
 
     assert log_path == expected
     assert expected.exists()
+
+
+def test_json_formatter_uses_record_timestamp():
+    formatter = logging_utils.JSONFormatter()
+    record = logging.LogRecord("ember.test", logging.INFO, __file__, 1, "hello %s", ("world",), None)
+    record.created = 1700000000.25
+    record.msecs = 250.0
+
+    entry = json.loads(formatter.format(record))
+
+    assert entry["timestamp"] == "2023-11-14T22:13:20.250+00:00"
+    assert entry["message"] == "hello world"
+    assert entry["level"] == "INFO"
+
+
+def test_buffered_handler_rolls_over_without_seeking(tmp_path: Path):
+    path = tmp_path / "rolling.log"
+    handler = logging_utils._BufferedRotatingFileHandler(
+        path, maxBytes=200, backupCount=2, encoding="utf-8"
+    )
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    for idx in range(30):
+        handler.handle(logging.LogRecord("ember.test", logging.INFO, __file__, 1, "line %02d " + "x" * 30, (idx,), None))
+    handler.close()
+
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["rolling.log", "rolling.log.1", "rolling.log.2"]
+    assert all(p.stat().st_size < 200 for p in tmp_path.iterdir())
+    assert path.read_text(encoding="utf-8").splitlines()[-1].startswith("line 29")
+
+
+def test_buffered_handler_counts_bytes_for_non_ascii(tmp_path: Path):
+    path = tmp_path / "rolling.log"
+    handler = logging_utils._BufferedRotatingFileHandler(
+        path, maxBytes=200, backupCount=2, encoding="utf-8"
+    )
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    for idx in range(30):
+        # 3 bytes per character in UTF-8
+        handler.handle(logging.LogRecord("ember.test", logging.INFO, __file__, 1, "%02d " + "日本語" * 5, (idx,), None))
+    handler.close()
+
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["rolling.log", "rolling.log.1", "rolling.log.2"]
+    assert all(p.stat().st_size < 200 for p in tmp_path.iterdir())
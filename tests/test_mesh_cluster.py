@@ -0,0 +1,68 @@
+"""Tests for mesh cluster bookkeeping."""
+
+from __future__ import annotations
+
+import time
+
+from ember.mesh.cluster import MeshCluster, MeshSettings
+from ember.mesh.node import NodeInfo, NodeStatus
+
+
+def _cluster() -> MeshCluster:
+    return MeshCluster(MeshSettings(), hostname="local", ip_address="127.0.0.1")
+
+
+def _node(last_seen_ts: float) -> NodeInfo:
+    node = NodeInfo(
+        node_id="peer",
+        hostname="peer",
+        ip_address="10.0.0.2",
+        port=8378,
+        capabilities=["llm"],
+        version="1.0.0",
+    )
+    node.mark_seen(last_seen_ts)
+    return node
+
+
+def test_rediscovered_node_comes_back_online_after_timeout():
+    cluster = _cluster()
+    settings = cluster.settings
+    cluster._discovery._add_node(_node(time.time() - settings.node_timeout - 1))
+
+    cluster._check_node_health()
+
+    assert cluster.get_status().nodes_offline == 1
+    assert "peer" not in cluster._next_check
+
+    # Same endpoint, capabilities and version: only marked as seen.
+    assert cluster._discovery._add_node(_node(time.time())) is False
+
+    status = cluster.get_status()
+    assert status.nodes_online == 2
+    assert status.nodes_offline == 0
+    assert [n.node_id for n in cluster.get_nodes_with_capability("llm")] == ["peer"]
+    assert cluster.nodes["peer"].status == NodeStatus.ONLINE
+    assert cluster._next_check["peer"] > time.time()
+
+
+def test_node_removed_during_ping_stays_removed():
+    cluster = _cluster()
+    settings = cluster.settings
+    # Due for a ping, but not yet timed out.
+    cluster._handle_node_found(_node(time.time() - settings.health_check_interval - 1))
+
+    def ping_many(targets):
+        cluster._handle_node_lost("peer")
+        return {target.node_id: object() for target in targets}
+
+    cluster._protocol.ping_many = ping_many
+    cluster._check_node_health()
+
+    status = cluster.get_status()
+    assert status.nodes_online == 1
+    assert status.nodes_offline == 0
+    assert status.total_nodes == 1
+    assert "peer" not in cluster._online_ids
+    assert "peer" not in cluster._next_check
+    assert all(node_id != "peer" for _, node_id in cluster._due_heap)
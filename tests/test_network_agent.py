@@ -120,6 +120,6 @@ def test_run_connectivity_checks_handles_success_and_failure(monkeypatch):
 
     results = network._run_connectivity_checks(["online:80", "offline:80"], timeout=0.1)
 
-    assert calls == [("online", 80), ("offline", 80)]
+    assert sorted(calls) == [("offline", 80), ("online", 80)]
     assert results[0]["reachable"] is True
     assert results[1]["reachable"] is False
@@ -0,0 +1,53 @@
+"""Tests for the RAG indexer."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+from ember.rag.embeddings import SimpleHashEmbedding
+from ember.rag.indexer import ChunkConfig, RAGIndexer
+from ember.rag.store import VectorStore
+
+
+def _indexer(tmp_path: Path) -> RAGIndexer:
+    store = VectorStore(tmp_path / "rag.db")
+    store.initialize()
+    return RAGIndexer(
+        store,
+        embedding_model=SimpleHashEmbedding(dimension=16),
+        chunk_config=ChunkConfig(min_chunk_size=1),
+    )
+
+
+def _stored_content(indexer: RAGIndexer, path: Path) -> str:
+    rows = indexer.store._conn.execute(
+        "SELECT content FROM documents WHERE source = ?", (str(path),)
+    ).fetchall()
+    return " ".join(row[0] for row in rows)
+
+
+def test_index_directory_skips_unchanged_then_reindexes_modified_file(tmp_path: Path):
+    docs_dir = tmp_path / "docs"
+    docs_dir.mkdir()
+    note = docs_dir / "note.md"
+    note.write_text("first version of the note\n", encoding="utf-8")
+    indexer = _indexer(tmp_path)
+
+    try:
+        first = indexer.index_directory(docs_dir)
+        assert (first.files_processed, first.skipped) == (1, 0)
+
+        second = indexer.index_directory(docs_dir)
+        assert (second.files_processed, second.skipped) == (0, 1)
+
+        note.write_text("second, longer version of the note\n", encoding="utf-8")
+        stat = note.stat()
+        os.utime(note, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        third = indexer.index_directory(docs_dir)
+        assert (third.files_processed, third.skipped) == (1, 0)
+        assert "second, longer version" in _stored_content(indexer, note)
+        assert "first version" not in _stored_content(indexer, note)
+    finally:
+        indexer.store.close()
@@ -0,0 +1,91 @@
+"""Tests for the SQLite-backed RAG vector store."""
+
+from __future__ import annotations
+
+import sqlite3
+from pathlib import Path
+
+import numpy as np
+
+from ember.rag.store import Document, VectorStore, content_hash
+
+
+def _create_old_database(db_path: Path, rows) -> None:
+    """Write a documents table as it looked before content hashes."""
+    conn = sqlite3.connect(str(db_path))
+    conn.execute("""
+        CREATE TABLE documents (
+            id TEXT PRIMARY KEY,
+            content TEXT NOT NULL,
+            source TEXT NOT NULL,
+            metadata TEXT,
+            embedding BLOB,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    """)
+    conn.executemany(
+        "INSERT INTO documents (id, content, source, metadata) VALUES (?, ?, ?, '{}')",
+        rows,
+    )
+    conn.commit()
+    conn.close()
+
+
+def test_initialize_backfills_content_hash_for_existing_documents(tmp_path: Path):
+    db_path = tmp_path / "rag.db"
+    _create_old_database(db_path, [("a", "alpha text", "a.md"), ("b", "beta text", "b.md")])
+
+    store = VectorStore(db_path)
+    store.initialize()
+    try:
+        hashes = dict(store._conn.execute("SELECT id, content_hash FROM documents"))
+        assert hashes == {"a": content_hash("alpha text"), "b": content_hash("beta text")}
+
+        # Backfilled hashes keep the matching cache entries alive.
+        vector = np.ones(4, dtype=np.float32)
+        store.cache_embeddings(
+            "model",
+            {content_hash("alpha text"): vector, content_hash("stale text"): vector},
+        )
+        assert store.prune_embedding_cache() == 1
+        assert list(store.get_cached_embeddings("model", [content_hash("alpha text")])) == [
+            content_hash("alpha text")
+        ]
+    finally:
+        store.close()
+
+
+def _open_store(db_path: Path) -> VectorStore:
+    store = VectorStore(db_path)
+    store.initialize()
+    return store
+
+
+def _doc(doc_id: str, values) -> Document:
+    return Document(
+        id=doc_id,
+        content=f"{doc_id} text",
+        source=f"{doc_id}.md",
+        embedding=np.array(values, dtype=np.float32),
+    )
+
+
+def test_search_ignores_sidecar_matrix_saved_before_a_write(tmp_path: Path):
+    db_path = tmp_path / "rag.db"
+    store = _open_store(db_path)
+    store.add_document(_doc("a", [1.0, 0.0]))
+    assert [doc.id for doc, _ in store.search(np.array([1.0, 0.0]))] == ["a"]
+    store.close()
+    assert (tmp_path / "rag.db.matrix.npy").exists()
+
+    # Another process writes after the sidecar was saved
+    writer = _open_store(db_path)
+    writer.add_document(_doc("b", [0.0, 1.0]))
+    writer.close()
+
+    reader = _open_store(db_path)
+    try:
+        results = reader.search(np.array([0.0, 1.0]))
+        assert [doc.id for doc, _ in results] == ["b", "a"]
+    finally:
+        reader.close()
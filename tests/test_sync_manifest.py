@@ -0,0 +1,47 @@
+"""Tests for vault manifest building."""
+
+from __future__ import annotations
+
+import os
+from datetime import datetime, timezone
+from pathlib import Path
+
+from ember.sync.manifest import FileInfo, ManifestBuilder, VaultManifest, compute_file_hash
+
+
+def _write_note(vault_dir: Path, name: str, mtime: float) -> Path:
+    path = vault_dir / "notes" / name
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(f"{name} contents\n", encoding="utf-8")
+    os.utime(path, (mtime, mtime))
+    return path
+
+
+def _prior_manifest(vault_dir: Path, created: float, paths) -> VaultManifest:
+    manifest = VaultManifest(
+        node_id="node",
+        vault_dir=vault_dir,
+        created_at=datetime.fromtimestamp(created, timezone.utc).isoformat(),
+    )
+    for path in paths:
+        stat = path.stat()
+        rel_path = str(path.relative_to(vault_dir))
+        manifest.files[rel_path] = FileInfo(
+            path=rel_path, hash="recorded", size=stat.st_size, mtime=stat.st_mtime
+        )
+    return manifest
+
+
+def test_build_reuses_hash_only_for_files_modified_before_prior_manifest(tmp_path: Path):
+    created = 1_700_000_000.0
+    older = _write_note(tmp_path, "older.md", created - 60)
+    racy = _write_note(tmp_path, "racy.md", created)
+    newer = _write_note(tmp_path, "newer.md", created + 60)
+    prior = _prior_manifest(tmp_path, created, [older, racy, newer])
+
+    manifest = ManifestBuilder(tmp_path, "node").build(prior)
+
+    assert manifest.files["notes/older.md"].hash == "recorded"
+    # Written no earlier than the prior manifest, so the same mtime proves nothing
+    assert manifest.files["notes/racy.md"].hash == compute_file_hash(racy)
+    assert manifest.files["notes/newer.md"].hash == compute_file_hash(newer)